@@ -15,8 +15,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import sys
-import os
-import __main__
 
 from PyQt6.QtWidgets import (
     QWidget,
@@ -26,7 +24,7 @@ from PyQt6.QtWidgets import (
     QLabel,
 )
 from PyQt6.QtCore import QSize, Qt
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtGui import QImageReader, QPixmap, QPixmapCache
 from qfluentwidgets import (
     CardWidget,
     TitleLabel,
@@ -37,8 +35,14 @@ from qfluentwidgets import (
 )
 from qfluentwidgets import FluentIcon as FIF
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-import UI.ui_layout_settings as ls
+from . import ui_layout_settings as ls
+from .ui_resource import get_resource_path
+
+LICENSE_HTML = (
+    "Copyright (c) 2025 NCFXZ<br>"
+    'Licensed under the GNU General Public License v3.0 (GPLv3). See <a href="https://github.com/NCFXZ/QtPackageTool/blob/main/LICENSE">LICENSE</a> file for details.<br>'
+    'This program uses <a href="https://riverbankcomputing.com/software/pyqt/intro">PyQt6 (GPLv3)</a>.'
+)
 
 
 class AboutUI(QWidget):
@@ -48,6 +52,7 @@ class AboutUI(QWidget):
         """
         super().__init__()
         self.setObjectName("AboutUI")
+        self._logo_loaded = False
         self.setup_ui(version, release_date)
 
     def setup_ui(self, version: str, release_date: str) -> None:
@@ -59,7 +64,12 @@ class AboutUI(QWidget):
         scroll_area.setWidgetResizable(True)
         scroll_area.enableTransparentBackground()
         scroll_widget = QWidget()
-        scroll_widget.setStyleSheet("background:transparent;")
+        scroll_widget.setObjectName("scroll_widget")
+
+        # Suppress repaints while the widget tree is being built
+        self.setUpdatesEnabled(False)
+        scroll_widget.setUpdatesEnabled(False)
+
         layout = QVBoxLayout(scroll_widget)
 
         main_label = TitleLabel("About", self)
@@ -76,11 +86,8 @@ class AboutUI(QWidget):
         name_label = StrongBodyLabel("Qt Package Tool", self)
         version_label = CaptionLabel(f"Version: {version}", self)
         release_date_label = CaptionLabel(f"Release Date: {release_date}", self)
-        license_label = CaptionLabel(
-            "Copyright (c) 2025 NCFXZ<br>"
-            'Licensed under the GNU General Public License v3.0 (GPLv3). See <a href="https://github.com/NCFXZ/QtPackageTool/blob/main/LICENSE">LICENSE</a> file for details.<br>'
-            'This program uses <a href="https://riverbankcomputing.com/software/pyqt/intro">PyQt6 (GPLv3)</a>.'
-        )
+        license_label = CaptionLabel(LICENSE_HTML, self)
+        license_label.setTextFormat(Qt.TextFormat.RichText)
         license_label.setOpenExternalLinks(True)
 
         sys_info_label_layout.addWidget(name_label)
@@ -89,29 +96,15 @@ class AboutUI(QWidget):
         sys_info_label_layout.addWidget(license_label)
         sys_info_label_layout.addStretch(1)
 
-        sys_info_icon = QLabel(self)
-        if getattr(__main__, "__compiled__", False):
-            relative_logo_path = os.path.join("..", "resource", "images", "logo.png")
-        else:
-            relative_logo_path = os.path.join(
-                "..", "..", "resource", "images", "logo.png"
-            )
-        logo_path = os.path.join(os.path.dirname(__file__), relative_logo_path)
-        pixmap = QPixmap(logo_path)
-        pixmap = pixmap.scaled(
-            QSize(ls.LARGE_ICON_SIZE, ls.LARGE_ICON_SIZE),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        sys_info_icon.setPixmap(pixmap)
+        # The logo is loaded on first show, see load_logo()
+        self.sys_info_icon = QLabel(self)
+        self.sys_info_icon.setFixedSize(ls.LARGE_ICON_SIZE, ls.LARGE_ICON_SIZE)
 
-        sys_info_layout.addWidget(sys_info_icon)
+        sys_info_layout.addWidget(self.sys_info_icon)
         sys_info_layout.addSpacing(ls.SMALL_MARGIN)
         sys_info_layout.addLayout(sys_info_label_layout)
         sys_info_layout.addStretch(1)
-        sys_info_card_widget.setContentsMargins(
-            ls.SMALL_MARGIN, ls.NANO_MARGIN, ls.SMALL_MARGIN, ls.NANO_MARGIN
-        )
+        sys_info_card_widget.setContentsMargins(*ls.CARD_MARGINS)
 
         self.github_hyperlink = HyperlinkButton(
             "https://github.com/NCFXZ/QtPackageTool",
@@ -130,19 +123,47 @@ class AboutUI(QWidget):
         layout.addWidget(sys_info_card_widget)
         layout.addLayout(hyperlink_layout)
         layout.addStretch(1)
-        layout.setContentsMargins(
-            ls.MEDIUM_MARGIN, ls.MEDIUM_MARGIN, ls.MEDIUM_MARGIN, ls.MEDIUM_MARGIN
-        )
+        layout.setContentsMargins(*ls.PAGE_MARGINS)
 
         scroll_area.setWidget(scroll_widget)
         self.main_layout.addWidget(scroll_area)
 
-        self.setStyleSheet(ls.STYLE_SHEET)
+        scroll_widget.setUpdatesEnabled(True)
+        self.setUpdatesEnabled(True)
+
+    def load_logo(self) -> None:
+        """
+        Load the scaled logo, reusing the copy in QPixmapCache if available.
+        """
+        logo_path = get_resource_path("images", "logo.png")
+        cache_key = f"{logo_path}@{ls.LARGE_ICON_SIZE}"
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is None:
+            # Let the image reader decode straight to the target size
+            reader = QImageReader(logo_path)
+            scaled_size = reader.size().scaled(
+                QSize(ls.LARGE_ICON_SIZE, ls.LARGE_ICON_SIZE),
+                Qt.AspectRatioMode.KeepAspectRatio,
+            )
+            reader.setScaledSize(scaled_size)
+            pixmap = QPixmap.fromImage(reader.read())
+            QPixmapCache.insert(cache_key, pixmap)
+        self.sys_info_icon.setPixmap(pixmap)
+        self._logo_loaded = True
+
+    def showEvent(self, event) -> None:
+        """
+        Load the logo once the page is about to become visible.
+        """
+        if not self._logo_loaded:
+            self.load_logo()
+        super().showEvent(event)
 
 
 if __name__ == "__main__":
     sys.argv += ["-platform", "windows:darkmode=0"]
     app = QApplication(sys.argv)
+    app.setStyleSheet(ls.STYLE_SHEET)
     window = AboutUI("UNKNOWN", "UNKNOWN")
     window.show()
     sys.exit(app.exec())
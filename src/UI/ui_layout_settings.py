@@ -20,6 +20,10 @@ MEDIUM_MARGIN = 15
 LARGE_MARGIN = 20
 EXTRA_LARGE_MARGIN = 30
 
+# (left, top, right, bottom) margins of cards and page contents
+CARD_MARGINS = (SMALL_MARGIN, NANO_MARGIN, SMALL_MARGIN, NANO_MARGIN)
+PAGE_MARGINS = (MEDIUM_MARGIN, MEDIUM_MARGIN, MEDIUM_MARGIN, MEDIUM_MARGIN)
+
 SMALL_BORDER_RADIUS = 5
 MEDIUM_BORDER_RADIUS = 10
 LARGE_BORDER_RADIUS = 15
@@ -55,4 +59,7 @@ PROGRESS_BAR_WIDTH = 630
 NAVIGATION_BAR_WIDTH = 322
 NAVIGATION_MIN_EXPAND_WIDTH = 1007
 
-STYLE_SHEET = "SpinBox {min-width: 65px;} ComboBox {min-width: 110px;} PushButton {min-width: 105px;} DoubleSpinBox {min-width: 65px;}"
+STYLE_SHEET = (
+    "SpinBox {min-width: 65px;} ComboBox {min-width: 110px;} PushButton {min-width: 105px;} DoubleSpinBox {min-width: 65px;}"
+    " #scroll_widget, #scroll_widget * {background: transparent;}"
+)
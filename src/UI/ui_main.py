@@ -14,12 +14,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
 import sys
-import __main__
 
+from PyQt6.QtCore import QSize, Qt, QTimer
 from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout
 from qfluentwidgets import (
     NavigationItemPosition,
     setTheme,
@@ -30,10 +29,14 @@ from qfluentwidgets import (
 from qfluentwidgets import FluentIcon as FIF
 from qframelesswindow.utils import getSystemAccentColor
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from UI.ui_package_settings import QtPackageSettingsUI
-from UI.ui_package_project import QtPackageProjectUI
-from UI.ui_about import AboutUI
+from .ui_package_settings import QtPackageSettingsUI
+from .ui_package_project import QtPackageProjectUI
+from .ui_about import AboutUI
+from . import ui_layout_settings as ls
+from .ui_resource import get_resource_path
+
+VERSION = "0.8.1 Beta"
+RELEASE_DATE = "2025/9/5"
 
 
 class MainUI(FluentWindow):
@@ -43,7 +46,11 @@ class MainUI(FluentWindow):
         """
         super().__init__()
         self.setObjectName("MainUI")
+        # Parsed once by the application and cascaded to every page
+        QApplication.instance().setStyleSheet(ls.STYLE_SHEET)
+        self.setUpdatesEnabled(False)
         self.setup_ui()
+        self.setUpdatesEnabled(True)
 
     def setup_ui(self) -> None:
         """
@@ -51,14 +58,12 @@ class MainUI(FluentWindow):
         """
 
         self.setWindowTitle("Qt Package Tool")
-        if getattr(__main__, "__compiled__", False):
-            relative_logo_path = os.path.join("..", "resource", "images", "logo.png")
-        else:
-            relative_logo_path = os.path.join(
-                "..", "..", "resource", "images", "logo.png"
-            )
-        logo_path = os.path.join(os.path.dirname(__file__), relative_logo_path)
-        self.setWindowIcon(QIcon(logo_path))
+        # Register the sizes the window manager asks for, decoded on demand
+        logo_path = get_resource_path("images", "logo.png")
+        window_icon = QIcon()
+        for size in (16, 24, 32, 48):
+            window_icon.addFile(logo_path, QSize(size, size))
+        self.setWindowIcon(window_icon)
         self.setMinimumSize(1200, 800)
         screen = QApplication.primaryScreen().availableGeometry()
         window_geometry = self.frameGeometry()
@@ -68,8 +73,18 @@ class MainUI(FluentWindow):
 
         self.qt_package_settings = QtPackageSettingsUI()
         self.qt_package_project = QtPackageProjectUI()
-        self.about_ui = AboutUI("0.8.1 Beta", "2025/9/5")
 
+        # The About page is built on first visit, only a placeholder is registered
+        self.about_ui = None
+        self.about_page = QWidget()
+        self.about_page.setObjectName("AboutPage")
+        about_page_layout = QVBoxLayout(self.about_page)
+        about_page_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Register all pages in one batch: one relayout, no per-insert page changes
+        self.navigationInterface.setUpdatesEnabled(False)
+        self.stackedWidget.setUpdatesEnabled(False)
+        self.stackedWidget.blockSignals(True)
         self.addSubInterface(
             self.qt_package_settings,
             FIF.SETTING,
@@ -85,19 +100,43 @@ class MainUI(FluentWindow):
             isTransparent=False,
         )
         self.addSubInterface(
-            self.about_ui,
+            self.about_page,
             FIF.INFO,
             "About",
             position=NavigationItemPosition.BOTTOM,
             isTransparent=False,
         )
+        self.stackedWidget.blockSignals(False)
+        self.stackedWidget.setUpdatesEnabled(True)
+        self.navigationInterface.setUpdatesEnabled(True)
+        self.navigationInterface.update()
+        self.stackedWidget.currentChanged.connect(self.load_sub_interface)
 
         if sys.platform in ["win32"]:
-            setThemeColor(getSystemAccentColor(), save=False)
-            setTheme(Theme.AUTO)
+            # Restyle after the first frame instead of before it
+            QTimer.singleShot(0, self.apply_system_theme)
+
+    def apply_system_theme(self) -> None:
+        """
+        Follow the system accent color and light/dark theme.
+        """
+        setThemeColor(getSystemAccentColor(), save=False)
+        setTheme(Theme.AUTO)
+
+    def load_sub_interface(self, index: int) -> None:
+        """
+        Build the deferred sub-interface when its navigation entry is first opened.
+        """
+        if (
+            self.about_ui is None
+            and self.stackedWidget.currentWidget() is self.about_page
+        ):
+            self.about_ui = AboutUI(VERSION, RELEASE_DATE)
+            self.about_page.layout().addWidget(self.about_ui)
 
 
 if __name__ == "__main__":
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings)
     app = QApplication(sys.argv)
     w = MainUI()
     w.show()
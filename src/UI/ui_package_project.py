@@ -15,7 +15,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import sys
-import os
 
 from PyQt6.QtWidgets import (
     QWidget,
@@ -34,8 +33,10 @@ from qfluentwidgets import (
 )
 from qfluentwidgets import FluentIcon as FIF
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-import UI.ui_layout_settings as ls
+from . import ui_layout_settings as ls
+
+# Lines kept in the terminal, the oldest are dropped so appends stay cheap
+TERMINAL_MAX_BLOCKS = 10000
 
 
 class QtPackageProjectUI(QWidget):
@@ -56,7 +57,12 @@ class QtPackageProjectUI(QWidget):
         scroll_area.setWidgetResizable(True)
         scroll_area.enableTransparentBackground()
         scroll_widget = QWidget()
-        scroll_widget.setStyleSheet("background:transparent;")
+        scroll_widget.setObjectName("scroll_widget")
+
+        # Suppress repaints while the widget tree is being built
+        self.setUpdatesEnabled(False)
+        scroll_widget.setUpdatesEnabled(False)
+
         layout = QVBoxLayout(scroll_widget)
 
         main_label = TitleLabel("Package Project", self)
@@ -69,7 +75,10 @@ class QtPackageProjectUI(QWidget):
         self.package_terminal = TextBrowser(self)
         self.package_terminal.setFont(QFont("Consolas", 10))
         self.package_terminal.setMinimumHeight(400)
-        self.package_terminal.setText(
+        self.package_terminal.setAcceptRichText(False)
+        self.package_terminal.setUndoRedoEnabled(False)
+        self.package_terminal.document().setMaximumBlockCount(TERMINAL_MAX_BLOCKS)
+        self.package_terminal.setPlainText(
             'Terminal Outputs...\nClick the "Start Packaging" button to start packaging...'
         )
 
@@ -88,9 +97,7 @@ class QtPackageProjectUI(QWidget):
         package_layout.addSpacing(ls.SMALL_MARGIN)
         package_layout.addLayout(button_layout)
 
-        package_card_widget.setContentsMargins(
-            ls.SMALL_MARGIN, ls.NANO_MARGIN, ls.SMALL_MARGIN, ls.NANO_MARGIN
-        )
+        package_card_widget.setContentsMargins(*ls.CARD_MARGINS)
 
         # Main Layout
         layout.addWidget(main_label)
@@ -98,19 +105,19 @@ class QtPackageProjectUI(QWidget):
         layout.addWidget(package_label)
         layout.addWidget(package_card_widget)
         layout.addStretch(1)
-        layout.setContentsMargins(
-            ls.MEDIUM_MARGIN, ls.MEDIUM_MARGIN, ls.MEDIUM_MARGIN, ls.MEDIUM_MARGIN
-        )
+        layout.setContentsMargins(*ls.PAGE_MARGINS)
 
         scroll_area.setWidget(scroll_widget)
         self.main_layout.addWidget(scroll_area)
 
-        self.setStyleSheet(ls.STYLE_SHEET)
+        scroll_widget.setUpdatesEnabled(True)
+        self.setUpdatesEnabled(True)
 
 
 if __name__ == "__main__":
     sys.argv += ["-platform", "windows:darkmode=0"]
     app = QApplication(sys.argv)
+    app.setStyleSheet(ls.STYLE_SHEET)
     window = QtPackageProjectUI()
     window.show()
     sys.exit(app.exec())
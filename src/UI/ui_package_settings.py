@@ -24,8 +24,9 @@ from PyQt6.QtWidgets import (
     QApplication,
     QHeaderView,
     QTableWidget,
+    QStyleOptionViewItem,
 )
-from PyQt6.QtCore import QSize
+from PyQt6.QtCore import QSize, Qt, QModelIndex
 from qfluentwidgets import (
     CardWidget,
     ComboBox,
@@ -37,14 +38,27 @@ from qfluentwidgets import (
     BodyLabel,
     CaptionLabel,
     SwitchButton,
+    SpinBox,
     SmoothScrollArea,
     HyperlinkButton,
     TableWidget,
+    TableItemDelegate,
 )
 from qfluentwidgets import FluentIcon as FIF
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-import UI.ui_layout_settings as ls
+from . import ui_layout_settings as ls
+
+# Shared by every card icon, Qt copies the value on assignment
+SMALL_ICON_QSIZE = QSize(ls.SMALL_ICON_SIZE, ls.SMALL_ICON_SIZE)
+
+
+class CenteredItemDelegate(TableItemDelegate):
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        """
+        Center every cell at paint time instead of storing an alignment per item.
+        """
+        super().initStyleOption(option, index)
+        option.displayAlignment = Qt.AlignmentFlag.AlignCenter
 
 
 class QtPackageSettingsUI(QWidget):
@@ -65,24 +79,18 @@ class QtPackageSettingsUI(QWidget):
         scroll_area.setWidgetResizable(True)
         scroll_area.enableTransparentBackground()
         scroll_widget = QWidget()
-        scroll_widget.setStyleSheet("background:transparent;")
+        scroll_widget.setObjectName("scroll_widget")
+
+        # Suppress repaints while the widget tree is being built
+        self.setUpdatesEnabled(False)
+        scroll_widget.setUpdatesEnabled(False)
+
         layout = QVBoxLayout(scroll_widget)
 
         main_label = TitleLabel("Environment & Project Settings", self)
 
         # Environment
         env_label = StrongBodyLabel("Environment", self)
-        env_card_widget = CardWidget()
-        env_layout = QHBoxLayout(env_card_widget)
-
-        env_label_group_layout = QVBoxLayout()
-
-        env_title = BodyLabel("Qt Environment Configuration", self)
-        env_description = CaptionLabel(
-            "Select the Qt version and compiler to build your project", self
-        )
-        env_label_group_layout.addWidget(env_title)
-        env_label_group_layout.addWidget(env_description)
 
         env_qt_version_label = BodyLabel("Qt Version:", self)
         self.env_qt_version_combo_box = ComboBox(self)
@@ -92,24 +100,17 @@ class QtPackageSettingsUI(QWidget):
 
         self.env_button = PushButton(FIF.FOLDER, "Browse...", self)
 
-        env_icon = TransparentToolButton(FIF.TRANSPARENT, self)
-        env_icon.setFixedSize(ls.SMALL_ICON_SIZE, ls.SMALL_ICON_SIZE)
-        env_icon.setIconSize(QSize(ls.SMALL_ICON_SIZE, ls.SMALL_ICON_SIZE))
-
-        env_layout.addWidget(env_icon)
-        env_layout.addSpacing(ls.SMALL_MARGIN)
-        env_layout.addLayout(env_label_group_layout)
-        env_layout.addStretch(1)
-        env_layout.addWidget(env_qt_version_label)
-        env_layout.addWidget(self.env_qt_version_combo_box)
-        env_layout.addSpacing(ls.SMALL_MARGIN)
-        env_layout.addWidget(env_qt_mingw_label)
-        env_layout.addWidget(self.env_qt_mingw_combo_box)
-        env_layout.addSpacing(ls.SMALL_MARGIN)
-        env_layout.addWidget(self.env_button)
-
-        env_card_widget.setContentsMargins(
-            ls.SMALL_MARGIN, ls.NANO_MARGIN, ls.SMALL_MARGIN, ls.NANO_MARGIN
+        env_card_widget = self.create_setting_card(
+            FIF.TRANSPARENT,
+            "Qt Environment Configuration",
+            "Select the Qt version and compiler to build your project",
+            env_qt_version_label,
+            self.env_qt_version_combo_box,
+            None,
+            env_qt_mingw_label,
+            self.env_qt_mingw_combo_box,
+            None,
+            self.env_button,
         )
 
         self.env_compiler_mingw_version_hyperlink = HyperlinkButton(
@@ -124,15 +125,6 @@ class QtPackageSettingsUI(QWidget):
 
         # Project Selection
         project_label = StrongBodyLabel("Project", self)
-        project_select_card_widget = CardWidget()
-        project_layout = QHBoxLayout(project_select_card_widget)
-
-        project_select_label_group_layout = QVBoxLayout()
-
-        project_select_title = BodyLabel("Project Selection", self)
-        project_select_description = CaptionLabel(
-            "Select a Qt project (.pro) file to configure the project", self
-        )
 
         self.project_select_edit = LineEdit(self)
         self.project_select_edit.setPlaceholderText(
@@ -141,122 +133,61 @@ class QtPackageSettingsUI(QWidget):
         self.project_select_edit.setReadOnly(True)
         self.project_select_edit.setMinimumWidth(ls.LARGE_EDIT_WIDTH)
 
-        project_select_label_group_layout.addWidget(project_select_title)
-        project_select_label_group_layout.addWidget(project_select_description)
-
-        project_select_icon = TransparentToolButton(FIF.DOCUMENT, self)
-        project_select_icon.setFixedSize(ls.SMALL_ICON_SIZE, ls.SMALL_ICON_SIZE)
-        project_select_icon.setIconSize(QSize(ls.SMALL_ICON_SIZE, ls.SMALL_ICON_SIZE))
-
         self.project_button = PushButton(FIF.FOLDER, "Browse...", self)
 
-        project_layout.addWidget(project_select_icon)
-        project_layout.addSpacing(ls.SMALL_MARGIN)
-        project_layout.addLayout(project_select_label_group_layout)
-        project_layout.addStretch(1)
-        project_layout.addWidget(self.project_select_edit)
-        project_layout.addSpacing(ls.SMALL_MARGIN)
-        project_layout.addWidget(self.project_button)
-
-        project_select_card_widget.setContentsMargins(
-            ls.SMALL_MARGIN, ls.NANO_MARGIN, ls.SMALL_MARGIN, ls.NANO_MARGIN
+        project_select_card_widget = self.create_setting_card(
+            FIF.DOCUMENT,
+            "Project Selection",
+            "Select a Qt project (.pro) file to configure the project",
+            self.project_select_edit,
+            None,
+            self.project_button,
         )
 
         # Build Options
-        build_card_widget = CardWidget()
-        build_layout = QHBoxLayout(build_card_widget)
-
-        build_label_group_layout = QVBoxLayout()
-
-        build_title = BodyLabel("Build Options", self)
-        build_description = CaptionLabel(
-            "Select the build configuration for your project", self
-        )
-        build_label_group_layout.addWidget(build_title)
-        build_label_group_layout.addWidget(build_description)
-
         self.build_combo_box = ComboBox(self)
         self.build_combo_box.addItems(["Release", "Debug"])
 
-        build_icon = TransparentToolButton(FIF.COMMAND_PROMPT, self)
-        build_icon.setFixedSize(ls.SMALL_ICON_SIZE, ls.SMALL_ICON_SIZE)
-        build_icon.setIconSize(QSize(ls.SMALL_ICON_SIZE, ls.SMALL_ICON_SIZE))
-
-        build_layout.addWidget(build_icon)
-        build_layout.addSpacing(ls.SMALL_MARGIN)
-        build_layout.addLayout(build_label_group_layout)
-        build_layout.addStretch(1)
-        build_layout.addWidget(self.build_combo_box)
-
-        build_card_widget.setContentsMargins(
-            ls.SMALL_MARGIN, ls.NANO_MARGIN, ls.SMALL_MARGIN, ls.NANO_MARGIN
+        build_jobs_label = BodyLabel("Parallel Jobs:", self)
+        self.build_jobs_spin_box = SpinBox(self)
+        self.build_jobs_spin_box.setRange(1, 256)
+        self.build_jobs_spin_box.setValue(os.cpu_count() or 1)
+
+        build_card_widget = self.create_setting_card(
+            FIF.COMMAND_PROMPT,
+            "Build Options",
+            "Select the build configuration for your project",
+            build_jobs_label,
+            self.build_jobs_spin_box,
+            None,
+            self.build_combo_box,
         )
 
         # Output Path
-        output_path_card_widget = CardWidget()
-        output_path_layout = QHBoxLayout(output_path_card_widget)
-
-        output_path_label_group_layout = QVBoxLayout()
-
-        output_path_title = BodyLabel("Output Path", self)
-        output_path_description = CaptionLabel(
-            "Select the folder where the compiled application and deployment files will be saved",
-            self,
-        )
-        output_path_label_group_layout.addWidget(output_path_title)
-        output_path_label_group_layout.addWidget(output_path_description)
-
         self.output_path_edit = LineEdit(self)
         self.output_path_edit.setPlaceholderText("Choose an output folder...")
         self.output_path_edit.setReadOnly(True)
         self.output_path_edit.setMinimumWidth(ls.LARGE_EDIT_WIDTH)
 
-        output_path_icon = TransparentToolButton(FIF.SAVE, self)
-        output_path_icon.setFixedSize(ls.SMALL_ICON_SIZE, ls.SMALL_ICON_SIZE)
-        output_path_icon.setIconSize(QSize(ls.SMALL_ICON_SIZE, ls.SMALL_ICON_SIZE))
-
         self.output_path_button = PushButton(FIF.FOLDER, "Browse...", self)
 
-        output_path_layout.addWidget(output_path_icon)
-        output_path_layout.addSpacing(ls.SMALL_MARGIN)
-        output_path_layout.addLayout(output_path_label_group_layout)
-        output_path_layout.addStretch(1)
-        output_path_layout.addWidget(self.output_path_edit)
-        output_path_layout.addSpacing(ls.SMALL_MARGIN)
-        output_path_layout.addWidget(self.output_path_button)
-
-        output_path_card_widget.setContentsMargins(
-            ls.SMALL_MARGIN, ls.NANO_MARGIN, ls.SMALL_MARGIN, ls.NANO_MARGIN
+        output_path_card_widget = self.create_setting_card(
+            FIF.SAVE,
+            "Output Path",
+            "Select the folder where the compiled application and deployment files will be saved",
+            self.output_path_edit,
+            None,
+            self.output_path_button,
         )
 
         # Auto-Clean Build Files
-        clean_card_widget = CardWidget()
-        clean_layout = QHBoxLayout(clean_card_widget)
-
-        clean_label_group_layout = QVBoxLayout()
-
-        clean_title = BodyLabel("Auto-Clean Build Files", self)
-        clean_description = CaptionLabel(
-            "Remove all .cpp, .c, and .o files from the build folder after building",
-            self,
-        )
-        clean_label_group_layout.addWidget(clean_title)
-        clean_label_group_layout.addWidget(clean_description)
-
         self.clean_switch = SwitchButton(self)
 
-        clean_icon = TransparentToolButton(FIF.CODE, self)
-        clean_icon.setFixedSize(ls.SMALL_ICON_SIZE, ls.SMALL_ICON_SIZE)
-        clean_icon.setIconSize(QSize(ls.SMALL_ICON_SIZE, ls.SMALL_ICON_SIZE))
-
-        clean_layout.addWidget(clean_icon)
-        clean_layout.addSpacing(ls.SMALL_MARGIN)
-        clean_layout.addLayout(clean_label_group_layout)
-        clean_layout.addStretch(1)
-        clean_layout.addWidget(self.clean_switch)
-
-        clean_card_widget.setContentsMargins(
-            ls.SMALL_MARGIN, ls.NANO_MARGIN, ls.SMALL_MARGIN, ls.NANO_MARGIN
+        clean_card_widget = self.create_setting_card(
+            FIF.CODE,
+            "Auto-Clean Build Files",
+            "Remove all .cpp, .c, and .o files from the build folder after building",
+            self.clean_switch,
         )
 
         # External Files & Dependencies
@@ -268,24 +199,11 @@ class QtPackageSettingsUI(QWidget):
         external_card_widget = CardWidget()
         external_layout = QVBoxLayout(external_card_widget)
 
-        external_label_group_layout = QVBoxLayout()
-
-        external_title = BodyLabel("Include External Files / Folders", self)
-        external_description = CaptionLabel(
-            "Copy selected files or folders into the package directory", self
+        external_banner_layout = self.create_card_banner(
+            FIF.COPY,
+            "Include External Files / Folders",
+            "Copy selected files or folders into the package directory",
         )
-        external_label_group_layout.addWidget(external_title)
-        external_label_group_layout.addWidget(external_description)
-
-        external_icon = TransparentToolButton(FIF.COPY, self)
-        external_icon.setFixedSize(ls.SMALL_ICON_SIZE, ls.SMALL_ICON_SIZE)
-        external_icon.setIconSize(QSize(ls.SMALL_ICON_SIZE, ls.SMALL_ICON_SIZE))
-
-        external_banner_layout = QHBoxLayout()
-        external_banner_layout.addWidget(external_icon)
-        external_banner_layout.addSpacing(ls.SMALL_MARGIN)
-        external_banner_layout.addLayout(external_label_group_layout)
-        external_banner_layout.addStretch(1)
 
         self.external_table = TableWidget(self)
         self.external_table.setBorderVisible(True)
@@ -299,6 +217,7 @@ class QtPackageSettingsUI(QWidget):
             ["Source Path (Local File / Folder)", "Destination Path (In Package)"]
         )
         self.external_table.verticalHeader().hide()
+        self.external_table.setItemDelegate(CenteredItemDelegate(self.external_table))
 
         self.external_file_button = PushButton(FIF.DOCUMENT, "Select File", self)
         self.external_folder_button = PushButton(FIF.FOLDER, "Select Folder", self)
@@ -320,40 +239,25 @@ class QtPackageSettingsUI(QWidget):
         external_layout.addSpacing(ls.NANO_MARGIN)
         external_layout.addLayout(external_button_layout)
 
-        external_card_widget.setContentsMargins(
-            ls.SMALL_MARGIN, ls.NANO_MARGIN, ls.SMALL_MARGIN, ls.NANO_MARGIN
-        )
+        external_card_widget.setContentsMargins(*ls.CARD_MARGINS)
 
         # Dependencies
         dependencies_card_widget = CardWidget()
         dependencies_layout = QVBoxLayout(dependencies_card_widget)
 
-        dependencies_label_group_layout = QVBoxLayout()
-
-        dependencies_title = BodyLabel("Include Dependencies", self)
-        dependencies_description = CaptionLabel(
-            "All selected modules will be packaged automatically", self
-        )
-        dependencies_label_group_layout.addWidget(dependencies_title)
-        dependencies_label_group_layout.addWidget(dependencies_description)
-
-        dependencies_icon = TransparentToolButton(FIF.DEVELOPER_TOOLS, self)
-        dependencies_icon.setFixedSize(ls.SMALL_ICON_SIZE, ls.SMALL_ICON_SIZE)
-        dependencies_icon.setIconSize(QSize(ls.SMALL_ICON_SIZE, ls.SMALL_ICON_SIZE))
-
         dependencies_module_title = BodyLabel("Modules:", self)
         self.dependencies_module_combo_box = ComboBox(self)
         self.dependencies_import_button = PushButton(FIF.DOWNLOAD, "Import", self)
 
-        dependencies_banner_layout = QHBoxLayout()
-        dependencies_banner_layout.addWidget(dependencies_icon)
-        dependencies_banner_layout.addSpacing(ls.SMALL_MARGIN)
-        dependencies_banner_layout.addLayout(dependencies_label_group_layout)
-        dependencies_banner_layout.addStretch(1)
-        dependencies_banner_layout.addWidget(dependencies_module_title)
-        dependencies_banner_layout.addWidget(self.dependencies_module_combo_box)
-        dependencies_banner_layout.addSpacing(ls.SMALL_MARGIN)
-        dependencies_banner_layout.addWidget(self.dependencies_import_button)
+        dependencies_banner_layout = self.create_card_banner(
+            FIF.DEVELOPER_TOOLS,
+            "Include Dependencies",
+            "All selected modules will be packaged automatically",
+            dependencies_module_title,
+            self.dependencies_module_combo_box,
+            None,
+            self.dependencies_import_button,
+        )
 
         self.dependencies_table = TableWidget(self)
         self.dependencies_table.setBorderVisible(True)
@@ -374,6 +278,9 @@ class QtPackageSettingsUI(QWidget):
         )
         self.dependencies_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         self.dependencies_table.verticalHeader().hide()
+        self.dependencies_table.setItemDelegate(
+            CenteredItemDelegate(self.dependencies_table)
+        )
 
         self.dependencies_remove_button = PushButton(FIF.DELETE, "Remove", self)
         self.dependencies_remove_button.setObjectName("dependencies_remove_button")
@@ -389,9 +296,7 @@ class QtPackageSettingsUI(QWidget):
         dependencies_layout.addSpacing(ls.NANO_MARGIN)
         dependencies_layout.addLayout(dependencies_button_layout)
 
-        dependencies_card_widget.setContentsMargins(
-            ls.SMALL_MARGIN, ls.NANO_MARGIN, ls.SMALL_MARGIN, ls.NANO_MARGIN
-        )
+        dependencies_card_widget.setContentsMargins(*ls.CARD_MARGINS)
 
         # Main Layout
         layout.addWidget(main_label)
@@ -410,19 +315,59 @@ class QtPackageSettingsUI(QWidget):
         layout.addWidget(external_card_widget)
         layout.addWidget(dependencies_card_widget)
         layout.addStretch(1)
-        layout.setContentsMargins(
-            ls.MEDIUM_MARGIN, ls.MEDIUM_MARGIN, ls.MEDIUM_MARGIN, ls.MEDIUM_MARGIN
-        )
+        layout.setContentsMargins(*ls.PAGE_MARGINS)
 
         scroll_area.setWidget(scroll_widget)
         self.main_layout.addWidget(scroll_area)
 
-        self.setStyleSheet(ls.STYLE_SHEET)
+        scroll_widget.setUpdatesEnabled(True)
+        self.setUpdatesEnabled(True)
+
+    def create_card_banner(
+        self, icon: FIF, title: str, description: str, *controls: QWidget
+    ) -> QHBoxLayout:
+        """
+        Build a card row: icon, title and description, then the right-aligned controls.
+        A None in controls inserts a small spacing between two widgets.
+        """
+        label_group_layout = QVBoxLayout()
+        label_group_layout.addWidget(BodyLabel(title, self))
+        label_group_layout.addWidget(CaptionLabel(description, self))
+
+        icon_button = TransparentToolButton(icon, self)
+        icon_button.setFixedSize(SMALL_ICON_QSIZE)
+        icon_button.setIconSize(SMALL_ICON_QSIZE)
+
+        banner_layout = QHBoxLayout()
+        banner_layout.addWidget(icon_button)
+        banner_layout.addSpacing(ls.SMALL_MARGIN)
+        banner_layout.addLayout(label_group_layout)
+        banner_layout.addStretch(1)
+        for control in controls:
+            if control is None:
+                banner_layout.addSpacing(ls.SMALL_MARGIN)
+            else:
+                banner_layout.addWidget(control)
+        return banner_layout
+
+    def create_setting_card(
+        self, icon: FIF, title: str, description: str, *controls: QWidget
+    ) -> CardWidget:
+        """
+        Build a single-row setting card around create_card_banner.
+        """
+        card_widget = CardWidget()
+        card_widget.setLayout(
+            self.create_card_banner(icon, title, description, *controls)
+        )
+        card_widget.setContentsMargins(*ls.CARD_MARGINS)
+        return card_widget
 
 
 if __name__ == "__main__":
     sys.argv += ["-platform", "windows:darkmode=0"]
     app = QApplication(sys.argv)
+    app.setStyleSheet(ls.STYLE_SHEET)
     window = QtPackageSettingsUI()
     window.show()
     sys.exit(app.exec())
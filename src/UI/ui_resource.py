@@ -0,0 +1,33 @@
+# Qt Package Tool - A PyQt6-based application
+# Copyright (c) 2025 NCFXZ
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import __main__
+from functools import lru_cache
+
+# Folder containing "resource", computed once at import
+if getattr(__main__, "__compiled__", False):
+    BASE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+else:
+    BASE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+@lru_cache(maxsize=None)
+def get_resource_path(*parts: str) -> str:
+    """
+    Return the absolute path of a file under the resource folder.
+    """
+    return os.path.join(BASE_PATH, "resource", *parts)
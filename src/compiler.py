@@ -15,17 +15,120 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
-import glob
+import re
+import codecs
+import mmap
 import shutil
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from enum import IntEnum
 from pathlib import Path
 from loguru import logger
-from PyQt6.QtCore import QObject, QProcess, pyqtSignal, QProcessEnvironment
+from PyQt6.QtCore import (
+    QObject,
+    QProcess,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+    QProcessEnvironment,
+)
+
+STOPPED_HTML = '<span style="color:red; font-weight:bold;">Build stopped by user</span>'
+
+# Interval in ms for batching process output into one output_signal
+OUTPUT_FLUSH_INTERVAL = 50
+
+# Marks an output line the terminal should show as an error, stripped on display
+ERROR_LINE_PREFIX = "\x00error\x00"
+
+# Upper bound of threads copying external sources at once
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Copy group of destinations outside the output folder, never a path component
+OUTSIDE_GROUP_KEY = os.pardir
+
+# Files above this size (bytes) are copied without the system cache on Windows
+NO_BUFFERING_THRESHOLD = 16 * 1024 * 1024
+COPY_FILE_NO_BUFFERING = 0x00001000
+
+# Kernel-side file copy, resolved once; shutil.copy2 already does this on Linux
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    COPY_FILE_EX = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileExW
+    COPY_FILE_EX.argtypes = (
+        wintypes.LPCWSTR,
+        wintypes.LPCWSTR,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.POINTER(wintypes.BOOL),
+        wintypes.DWORD,
+    )
+    COPY_FILE_EX.restype = wintypes.BOOL
+else:
+    COPY_FILE_EX = None
+
+# robocopy threads per copied folder and the flags silencing its report
+ROBOCOPY_THREADS = 8
+ROBOCOPY_QUIET = ("/NFL", "/NDL", "/NJH", "/NJS", "/NC", "/NS", "/NP")
+
+# windeployqt processes deploying QML DLL folders at once
+QML_DEPLOY_WORKERS = min(4, os.cpu_count() or 1)
+
+# Threads deleting build artifacts at once
+CLEAN_WORKERS = 8
+
+# Time in ms a stopped process gets to exit before it is killed
+STOP_TIMEOUT = 2000
+
+# .pro files above this size (bytes) are memory-mapped instead of read
+PRO_MMAP_THRESHOLD = 64 * 1024
+
+# Marker file recording the last executable deployed by windeployqt
+DEPLOY_STAMP_NAME = ".windeployqt.stamp"
+
+# Runtime files windeployqt leaves next to the executable: Qt core DLL, platform plugin
+DEPLOYED_CORE_PATTERN = re.compile(r"^Qt\d+Cored?\.dll$", re.IGNORECASE)
+DEPLOYED_PLATFORM_PREFIX = "qwindows"
+
+# Build artifacts removed by clean_build_files
+CLEAN_EXTENSIONS = (".cpp", ".c", ".o")
+
+# First top-level "TARGET = name" assignment of a .pro file
+TARGET_PATTERN = re.compile(rb"(?mi)^[ \t]*TARGET[ \t]*=[ \t]*([^\r\n#]+)")
+
+
+class Stage(IntEnum):
+    """
+    Steps of the packaging pipeline, in execution order.
+    """
+
+    QMAKE = 0
+    MAKE = 1
+    DEPLOY = 2
+    COPY_SOURCES = 3
+    DEPLOY_QML = 4
+    DONE = 5
+
+
+# Error message prefix for a tool that fails during the given stage
+STAGE_FAILURE_MESSAGES = {
+    Stage.QMAKE: "qmake failed",
+    Stage.MAKE: "Build failed",
+    Stage.DEPLOY: "Deployment failed",
+    Stage.DEPLOY_QML: "Deployment failed",
+}
 
 
 class QtCompiler(QObject):
     output_signal = pyqtSignal(str)  # Output information
     finished_signal = pyqtSignal(Path)  # Compilation finished
     error_signal = pyqtSignal(str)  # Compilation error
+    copy_finished_signal = pyqtSignal()  # External sources copied
 
     def __init__(self):
         """
@@ -33,22 +136,66 @@ class QtCompiler(QObject):
         """
         super().__init__()
         self.process = QProcess(self)
-        self._make_started = False
-        self._deploy_started = False
-        self._copy_sources_started = False
-        self._qml_dll_deploy_count = 0
+        # stderr interleaves with stdout in order and shares its buffered path,
+        # error lines are still highlighted by the output handler
+        self.process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        self._stage = Stage.QMAKE
+
+        # Pending DLL groups and running windeployqt processes of the QML stage
+        self._qml_deploy_queue: list[list[str]] = []
+        self._qml_processes: list[QProcess] = []
 
         self.output_path = ""
         self.qt_bin = ""
         self.mingw_bin = ""
         self.project_file = ""
         self.external_sources = []
+        self._copy_entries: list[tuple[str, str]] = []
         self._qml_dll_need_deploy_files = []
+        self._pro_cache: dict[tuple, str] = {}
         self.is_release = False
         self.need_clean = False
+        self.parallel_jobs = 1
+        self._env_toolchain: tuple[str, str] | None = None
+
+        # Per-build paths, fixed in compile_qt_project
+        self._config_dir = "debug"
+        self._build_dir = ""
+        self._exe_path = ""
+        self._deploy_stamp_path = ""
+        self._deploy_stamp_key = ""
+        self._qmake_exe = ""
+        self._make_tool = ""
+        self._windeploy_exe = ""
+        self._qml_path = ""
+
+        # Keep partial multi-byte sequences between reads
+        self._stdout_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        # Coalesce stdout chunks so the terminal relayouts once per interval,
+        # a trailing partial line waits here until its newline arrives
+        self._output_buffer: list[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(OUTPUT_FLUSH_INTERVAL)
+        self._flush_timer.timeout.connect(self.flush_output)
+
+        # Indexed by Stage: starts the work of that stage
+        self._stage_handlers = (
+            self.run_qmake,
+            self.run_make,
+            self.run_windeployqt,
+            self.copy_external_sources,
+            self.deploy_qml_dll,
+            self.finish_packaging,
+        )
+
+        # Background copy of the external sources and the flag that cancels it
+        self._copy_thread: threading.Thread | None = None
+        self._copy_cancel = threading.Event()
 
+        self.copy_finished_signal.connect(self.copy_sources_finished)
         self.process.readyReadStandardOutput.connect(self.handle_stdout)
-        self.process.readyReadStandardError.connect(self.handle_stderr)
         self.process.finished.connect(self.process_finished)
 
     def compile_qt_project(
@@ -60,25 +207,24 @@ class QtCompiler(QObject):
         external_sources: list[dict],
         is_release: bool,
         need_clean: bool,
+        parallel_jobs: int = 1,
     ) -> None:
         """
         Compile a Qt project using QProcess.
         """
-        if self.process.state() != QProcess.ProcessState.NotRunning:
-            self.stop_process()
+        self.stop_process()
 
         # Ensure build directory exists
         os.makedirs(output_path, exist_ok=True)
 
-        # Configure environment variables
-        env = os.environ.copy()
-        env["PATH"] += ";" + qt_bin + ";" + mingw_bin
-        self.process.setProcessEnvironment(self._dict_to_qt_env(env))
+        # Configure environment variables, reused while the toolchain is the same
+        if self._env_toolchain != (qt_bin, mingw_bin):
+            env = QProcessEnvironment.systemEnvironment()
+            env.insert("PATH", os.pathsep.join([env.value("PATH"), qt_bin, mingw_bin]))
+            self.process.setProcessEnvironment(env)
+            self._env_toolchain = (qt_bin, mingw_bin)
 
-        self._make_started = False
-        self._deploy_started = False
-        self._copy_sources_started = False
-        self._qml_dll_deploy_count = 0
+        self._stage = Stage.QMAKE
 
         self.output_path = output_path
         self.qt_bin = qt_bin
@@ -87,206 +233,508 @@ class QtCompiler(QObject):
         self.external_sources = external_sources
         self.is_release = is_release
         self.need_clean = need_clean
+        self.parallel_jobs = max(1, parallel_jobs)
+        self._config_dir = "release" if is_release else "debug"
+        self._build_dir = os.path.abspath(os.path.join(output_path, self._config_dir))
+        self._exe_path = os.path.join(
+            self._build_dir, self.get_exe_name_from_pro(project_file)
+        )
+        # Kept in the qmake build folder so it is not shipped with the package
+        self._deploy_stamp_path = os.path.join(output_path, DEPLOY_STAMP_NAME)
+        self._qmake_exe = str((Path(qt_bin) / "qmake.exe").resolve())
+        self._make_tool = str((Path(mingw_bin) / "mingw32-make.exe").resolve())
+        self._windeploy_exe = str((Path(qt_bin) / "windeployqt.exe").resolve())
+        self._qml_path = str((Path(qt_bin).parent / "qml").resolve())
         logger.info(
-            f"project_file: {project_file}, output_path: {output_path}, qt_bin: {qt_bin}, mingw_bin: {mingw_bin}, external_sources: {external_sources}, is_release: {is_release}, need_clean: {need_clean}"
+            f"project_file: {project_file}, output_path: {output_path}, qt_bin: {qt_bin}, mingw_bin: {mingw_bin}, external_sources: {external_sources}, is_release: {is_release}, need_clean: {need_clean}, parallel_jobs: {self.parallel_jobs}"
         )
 
-        # Check whether QML DLL files need to be deployed
+        # One pass over the table: what to copy and which QML DLLs to deploy
+        self._copy_entries = []
         self._qml_dll_need_deploy_files = []
         for entry in external_sources:
-            type = entry.get("Type")
-            if type.strip().casefold() == "qml":
-                self._qml_dll_need_deploy_files.append(entry.get("Destination"))
+            src = entry.get("Source")
+            dest_rel = entry.get("Destination")
+            if not src or not dest_rel:
+                logger.warning(f"Invalid entry: {entry}")
+                self.output_signal.emit(f"Invalid entry, skipping: {entry}")
+                continue
+            self._copy_entries.append((src, dest_rel))
+            if (entry.get("Type") or "").strip().casefold() == "qml":
+                self._qml_dll_need_deploy_files.append(dest_rel)
         logger.info(f"QML deployment required for: {self._qml_dll_need_deploy_files}")
 
-        # Step 1: qmake
-        config_type = "release" if is_release else "debug"
-        qmake_exe = (Path(qt_bin) / "qmake.exe").resolve()
-        if not qmake_exe.exists():
-            logger.error(f"qmake not found: {qmake_exe}")
-            self.error_signal.emit(f"qmake not found: {qmake_exe}")
-            return
+        # Check every tool once up front instead of in each stage
+        required_paths = [
+            ("qmake", self._qmake_exe),
+            ("Make tool", self._make_tool),
+            ("windeployqt", self._windeploy_exe),
+        ]
+        if self._qml_dll_need_deploy_files:
+            required_paths.append(("QML folder", self._qml_path))
+        for name, path in required_paths:
+            if not os.path.exists(path):
+                logger.error(f"{name} not found: {path}")
+                self.error_signal.emit(f"{name} not found: {path}")
+                return
 
-        args = [project_file, f"CONFIG+={config_type}"]
-        logger.info(f"Setting working directory: {output_path}")
-        logger.info(f"Running: {qmake_exe} {args}")
-        self.output_signal.emit("Running qmake...\n")
-        self.process.setWorkingDirectory(output_path)
-        self.process.start(str(qmake_exe), args)
+        self._stage_handlers[self._stage]()
 
+    @pyqtSlot()
     def handle_stdout(self) -> None:
         """
         Handle standard output from the process.
         """
         data = self.process.readAllStandardOutput()
-        text = bytes(data).decode("utf-8")
-        logger.info(f"Compiler output: {text.strip()}")
-        self.output_signal.emit(text)
-
-    def handle_stderr(self) -> None:
+        text = self._stdout_decoder.decode(data.data())
+        if not text:
+            return
+        # Lazy: formatted and stripped only if a sink accepts the level
+        logger.opt(lazy=True).info("Compiler output: {}", text.strip)
+        self._output_buffer.append(text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @pyqtSlot()
+    def flush_output(self, final: bool = False) -> None:
         """
-        Handle standard error from the process.
+        Emit the buffered complete lines of standard output as a single message.
+        final also emits a trailing partial line, once the process has ended.
         """
-        data = self.process.readAllStandardError()
-        text = bytes(data).decode("utf-8")
-        logger.error(f"Compiler error: {text.strip()}")
-        self.output_signal.emit("[Error] " + text)
+        self._flush_timer.stop()
+        if not self._output_buffer:
+            return
+        text = "".join(self._output_buffer)
+        self._output_buffer.clear()
+        if not final:
+            text, newline, partial = text.rpartition("\n")
+            if partial:
+                self._output_buffer.append(partial)
+            if not newline:
+                return
+        self.output_signal.emit(text)
 
     def get_exe_name_from_pro(self, project_file: str) -> str:
         """
         Get the executable name from the .pro file.
         """
+        stat = os.stat(project_file)
+        cache_key = (project_file, stat.st_mtime_ns, stat.st_size)
+        if cache_key in self._pro_cache:
+            return self._pro_cache[cache_key]
+
         exe_name = os.path.splitext(os.path.basename(project_file))[
             0
         ]  # Default: same name as .pro
-        with open(project_file, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip().lower().startswith("target"):
-                    parts = line.split("=")
-                    if len(parts) > 1:
-                        exe_name = parts[1].strip()
+        with open(project_file, "rb") as f:
+            if stat.st_size > PRO_MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    match = TARGET_PATTERN.search(data)
+            else:
+                match = TARGET_PATTERN.search(f.read())
+        if match:
+            exe_name = match.group(1).strip().decode("utf-8", "replace")
 
         logger.info(f"Executable name derived from .pro file: {exe_name}")
-        return exe_name + ".exe"
+        self._pro_cache[cache_key] = exe_name + ".exe"
+        return self._pro_cache[cache_key]
 
+    @pyqtSlot()
     def process_finished(self) -> None:
         """
         Handle process finished event.
         """
+        # Flush bytes left over from an incomplete trailing character
+        tail = self._stdout_decoder.decode(b"", final=True)
+        if tail:
+            self._output_buffer.append(tail)
+        self.flush_output(final=True)
+
         exit_code = self.process.exitCode()
-        if (
-            self.process.exitStatus() == QProcess.ExitStatus.NormalExit
-            and exit_code == 0
-        ):
-            if not self._make_started:
-                # Step 1: qmake finished, start make
-                self._make_started = True
-                make_tool = (Path(self.mingw_bin) / "mingw32-make.exe").resolve()
-                if not make_tool.exists():
-                    logger.error(f"Make tool not found: {make_tool}")
-                    self.error_signal.emit(f"Make tool not found: {make_tool}")
-                    return
+        if self.process.exitStatus() != QProcess.ExitStatus.NormalExit or exit_code:
+            self.stage_failed(exit_code)
+            return
 
-                logger.info(f"Running: {make_tool}")
-                self.output_signal.emit("Running make...\n")
-                self.process.start(str(make_tool))
-
-            elif not self._deploy_started:
-                # Step 2: make finished, start windeployqt
-                self._deploy_started = True
-                windeploy_exe = (Path(self.qt_bin) / "windeployqt.exe").resolve()
-                exe_name = self.get_exe_name_from_pro(self.project_file)
-                config_dir = "release" if self.is_release else "debug"
-                exe_path = (Path(self.output_path) / config_dir / exe_name).resolve()
-
-                if not exe_path.exists():
-                    logger.error(f"Executable not found: {exe_path}")
-                    self.error_signal.emit(f"Executable not found: {exe_path}")
-                    return
+        if self._stage == Stage.DEPLOY:
+            self.write_deploy_stamp()
+        self.advance_stage()
 
-                logger.info(f"Running: {windeploy_exe} {[exe_path]}")
-                self.output_signal.emit("Running windeployqt...\n")
-                self.process.start(str(windeploy_exe), [str(exe_path)])
-
-            elif not self._copy_sources_started and self.external_sources:
-                # Step 3: Copy sources
-                self._copy_sources_started = True
-                config_dir = "release" if self.is_release else "debug"
-                build_dir = (Path(self.output_path) / config_dir).resolve()
-                logger.info(f"Copying external sources to: {build_dir}")
-                self.output_signal.emit("Copying external sources...\n")
-                self.copy_sources_to_output(self.external_sources, str(build_dir))
-
-            elif self._qml_dll_deploy_count < len(self._qml_dll_need_deploy_files):
-                # Step 4: Deploy QML DLLs
-                dll = self._qml_dll_need_deploy_files[self._qml_dll_deploy_count]
-                config_dir = "release" if self.is_release else "debug"
-                dll_path = (
-                    Path(self.output_path) / config_dir / dll.lstrip("/\\")
-                ).resolve()
-                windeploy_exe = os.path.join(self.qt_bin, "windeployqt.exe")
-                qml_path = (Path(self.qt_bin).parent / "qml").resolve()
-
-                if not os.path.exists(windeploy_exe) or not os.path.exists(qml_path):
-                    logger.error(f"Path not found: {windeploy_exe} or {qml_path}")
-                    self.error_signal.emit(
-                        f"Path not found: {windeploy_exe} or {qml_path}"
-                    )
-                    return
+    def advance_stage(self) -> None:
+        """
+        Move to the next pipeline stage and start it.
+        """
+        self._stage = Stage(self._stage + 1)
+        self._stage_handlers[self._stage]()
 
-                logger.info(f"Running: {windeploy_exe} {dll_path} --qmldir {qml_path}")
-                self.output_signal.emit(f"Deploying QML DLL: {dll_path}\n")
-                self.process.start(
-                    windeploy_exe, [str(dll_path), "--qmldir", str(qml_path)]
-                )
-                self._qml_dll_deploy_count += 1
+    def stage_failed(self, exit_code: int) -> None:
+        """
+        Report the failure of the tool run by the current stage.
+        """
+        if exit_code != 0:
+            message = STAGE_FAILURE_MESSAGES.get(self._stage, "Process failed")
+            logger.error(f"{message} with exit code {exit_code}")
+            self.error_signal.emit(f"{message} with exit code {exit_code}")
+        else:
+            logger.error(f"Process exited abnormally, code: {exit_code}")
+            self.error_signal.emit(f"Process exited abnormally, code: {exit_code}")
 
-            else:
-                config_dir = "release" if self.is_release else "debug"
-                build_dir = (Path(self.output_path) / config_dir).resolve()
-                logger.info(f"Build successful to directory: {build_dir}")
-                self.finished_signal.emit(build_dir)
+    def run_qmake(self) -> None:
+        """
+        Stage QMAKE: generate the Makefiles.
+        """
+        args = [self.project_file, f"CONFIG+={self._config_dir}"]
+        logger.info(f"Setting working directory: {self.output_path}")
+        logger.info(f"Running: {self._qmake_exe} {args}")
+        self.output_signal.emit("Running qmake...\n")
+        self.process.setWorkingDirectory(self.output_path)
+        self.process.start(self._qmake_exe, args)
 
-                if self.need_clean:
-                    logger.info(f"Cleaning build files in: {build_dir}")
-                    self.clean_build_files()
+    def run_make(self) -> None:
+        """
+        Stage MAKE: build the project.
+        """
+        args = [f"-j{self.parallel_jobs}"]
+        logger.info(f"Running: {self._make_tool} {args}")
+        self.output_signal.emit("Running make...\n")
+        self.process.start(self._make_tool, args)
 
-                self.output_signal.emit(
-                    '<span style="color:green; font-weight:bold;">Packaging finished!</span>'
+    def run_windeployqt(self) -> None:
+        """
+        Stage DEPLOY: deploy the Qt runtime next to the executable.
+        """
+        if not os.path.exists(self._exe_path):
+            logger.error(f"Executable not found: {self._exe_path}")
+            self.error_signal.emit(f"Executable not found: {self._exe_path}")
+            return
+
+        # Skip the deployment when this exact executable was already deployed
+        exe_stat = os.stat(self._exe_path)
+        self._deploy_stamp_key = (
+            f"{self._exe_path}|{exe_stat.st_mtime_ns}|{exe_stat.st_size}|{self.qt_bin}"
+        )
+        try:
+            with open(self._deploy_stamp_path, "r", encoding="utf-8") as f:
+                up_to_date = f.read() == self._deploy_stamp_key
+        except OSError:
+            up_to_date = False
+        # The stamp alone misses a runtime deleted or cleaned out since
+        if up_to_date and self.has_deployed_runtime():
+            logger.info(f"windeployqt up to date for: {self._exe_path}")
+            self.output_signal.emit("windeployqt up to date, skipping...\n")
+            self.advance_stage()
+            return
+
+        logger.info(f"Running: {self._windeploy_exe} {[self._exe_path]}")
+        self.output_signal.emit("Running windeployqt...\n")
+        self.process.start(self._windeploy_exe, [self._exe_path])
+
+    def has_deployed_runtime(self) -> bool:
+        """
+        Check that the Qt core DLL and the platform plugin are next to the executable.
+        """
+        exe_dir = os.path.dirname(self._exe_path)
+        try:
+            with os.scandir(exe_dir) as entries:
+                if not any(DEPLOYED_CORE_PATTERN.match(e.name) for e in entries):
+                    return False
+            with os.scandir(os.path.join(exe_dir, "platforms")) as entries:
+                return any(
+                    e.name.lower().startswith(DEPLOYED_PLATFORM_PREFIX) for e in entries
                 )
+        except OSError:
+            return False
 
-        else:
-            if exit_code != 0:
-                if self._make_started:
-                    logger.error(f"Build failed with exit code {exit_code}")
-                    self.error_signal.emit(f"Build failed with exit code {exit_code}")
-                elif self._deploy_started:
-                    logger.error(f"Deployment failed with exit code {exit_code}")
-                    self.error_signal.emit(
-                        f"Deployment failed with exit code {exit_code}"
-                    )
+    def write_deploy_stamp(self) -> None:
+        """
+        Record the executable that windeployqt has just deployed.
+        """
+        try:
+            with open(self._deploy_stamp_path, "w", encoding="utf-8") as f:
+                f.write(self._deploy_stamp_key)
+        except OSError as e:
+            logger.warning(f"Could not write deploy stamp: {e}")
 
-            elif self.process.exitStatus() != QProcess.ExitStatus.NormalExit:
-                logger.error(f"Process exited abnormally, code: {exit_code}")
-                self.error_signal.emit(f"Process exited abnormally, code: {exit_code}")
+    def copy_external_sources(self) -> None:
+        """
+        Stage COPY_SOURCES: copy the external files and folders.
+        """
+        if not self._copy_entries:
+            self.advance_stage()
+            return
+
+        logger.info(f"Copying external sources to: {self._build_dir}")
+        self.output_signal.emit("Copying external sources...\n")
+        # Off the GUI thread, signals emitted by the worker are queued back to it
+        self._copy_cancel = threading.Event()
+        self._copy_thread = threading.Thread(
+            target=self.copy_sources_to_output,
+            args=(self._copy_entries, self._build_dir, self._copy_cancel),
+            daemon=True,
+        )
+        self._copy_thread.start()
 
-    def copy_sources_to_output(self, external_source, output_dir: str) -> None:
+    @pyqtSlot()
+    def copy_sources_finished(self) -> None:
         """
-        Copy source files and folders to the output directory based on the external source.
+        Continue the pipeline once the background copy has succeeded.
         """
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        # Queued from the copy thread, it can arrive after the run was stopped
+        if self._copy_cancel.is_set():
+            return
+        if self._stage == Stage.COPY_SOURCES:
+            self.advance_stage()
 
-        for entry in external_source:
-            src = entry.get("Source")
-            dest_rel = entry.get("Destination")
-            logger.info(f"Try to copy {src} to {dest_rel}")
+    def deploy_qml_dll(self) -> None:
+        """
+        Stage DEPLOY_QML: deploy the QML DLLs with their QML imports.
+        """
+        if not self._qml_dll_need_deploy_files:
+            self.advance_stage()
+            return
 
-            if not src or not dest_rel:
-                logger.warning(f"Invalid entry: {entry}")
-                self.output_signal.emit(f"Invalid entry, skipping: {entry}")
-                continue
+        # DLLs of one folder share their runtime files and go into one call,
+        # separate folders do not touch each other and are deployed concurrently
+        folders: dict[str, list[str]] = {}
+        for dll in self._qml_dll_need_deploy_files:
+            dll_path = os.path.join(self._build_dir, dll.lstrip("/\\"))
+            folders.setdefault(os.path.dirname(dll_path), []).append(dll_path)
+        self._qml_deploy_queue = list(folders.values())
+
+        for _ in range(min(QML_DEPLOY_WORKERS, len(self._qml_deploy_queue))):
+            self.start_qml_deploy()
 
+    def start_qml_deploy(self) -> None:
+        """
+        Run windeployqt for the next queued folder of QML DLLs.
+        """
+        dll_paths = self._qml_deploy_queue.pop(0)
+        process = QProcess(self)
+        process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        process.setProcessEnvironment(self.process.processEnvironment())
+        process.finished.connect(partial(self.qml_deploy_finished, process))
+        self._qml_processes.append(process)
+
+        args = [*dll_paths, "--qmldir", self._qml_path]
+        logger.info(f"Running: {self._windeploy_exe} {args}")
+        for dll_path in dll_paths:
+            self.output_signal.emit(f"Deploying QML DLL: {dll_path}\n")
+        process.start(self._windeploy_exe, args)
+
+    def qml_deploy_finished(
+        self,
+        process: QProcess,
+        exit_code: int,
+        exit_status: QProcess.ExitStatus,
+    ) -> None:
+        """
+        Report one QML deployment and start the next, or finish the stage.
+        """
+        self._qml_processes.remove(process)
+        process.deleteLater()
+
+        # Read in one piece so concurrent deployments do not interleave
+        text = process.readAllStandardOutput().data().decode("utf-8", "replace")
+        if text:
+            logger.opt(lazy=True).info("Compiler output: {}", text.strip)
+            self.output_signal.emit(text)
+
+        if exit_status != QProcess.ExitStatus.NormalExit or exit_code:
+            self.stop_qml_deploys()
+            self.stage_failed(exit_code)
+        elif self._qml_deploy_queue:
+            self.start_qml_deploy()
+        elif not self._qml_processes:
+            self.advance_stage()
+
+    def stop_qml_deploys(self) -> None:
+        """
+        Drop the queued QML deployments and kill the running ones silently.
+        """
+        self._qml_deploy_queue.clear()
+        for process in self._qml_processes:
+            process.finished.disconnect()
+            process.kill()
+            process.waitForFinished(STOP_TIMEOUT)
+            process.deleteLater()
+        self._qml_processes.clear()
+
+    def finish_packaging(self) -> None:
+        """
+        Stage DONE: report the result and clean up.
+        """
+        logger.info(f"Build successful to directory: {self._build_dir}")
+        if self.need_clean:
+            logger.info(f"Cleaning build files in: {self._build_dir}")
+            self.clean_build_files()
+
+        # Last, the receiver closes the run with its finished message
+        self.finished_signal.emit(Path(self._build_dir))
+
+    def copy_sources_to_output(
+        self,
+        copy_entries: list[tuple[str, str]],
+        output_dir: str,
+        cancel: threading.Event,
+    ) -> None:
+        """
+        Copy (source, destination) entries into the output directory.
+        Runs on a worker thread and stops early once cancel is set.
+        """
+        try:
+            self.copy_entries_to_output(copy_entries, output_dir, cancel)
+        except Exception as e:
+            # Any escape would end the thread without a signal and stall the run
+            logger.exception(f"Failed to copy external sources: {e}")
+            if not cancel.is_set():
+                self.error_signal.emit(f"Failed to copy external sources: {e}")
+
+    def copy_entries_to_output(
+        self,
+        copy_entries: list[tuple[str, str]],
+        output_dir: str,
+        cancel: threading.Event,
+    ) -> None:
+        """
+        Copy the entries in destination groups, the body of the copy thread.
+        """
+        tasks = []
+        parent_dirs = set()
+        for src, dest_rel in copy_entries:
+            logger.info(f"Try to copy {src} to {dest_rel}")
             dest = os.path.join(output_dir, dest_rel.lstrip("/"))
+            if os.path.isfile(src):
+                parent_dirs.add(os.path.dirname(dest))
+            elif not os.path.isdir(src):
+                continue
+            tasks.append((src, dest))
+
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            # Created once up front instead of by every worker, shallow first so
+            # deeper makedirs calls find their ancestors already in place
+            for parent_dir in sorted(parent_dirs, key=len):
+                os.makedirs(parent_dir, exist_ok=True)
+        except OSError as e:
+            logger.error(f"Failed to create output folder: {e}")
+            self.error_signal.emit(f"Failed to create output folder: {e}")
+            return
 
-            try:
-                if os.path.isfile(src):
-                    os.makedirs(os.path.dirname(dest), exist_ok=True)
-                    shutil.copy2(src, dest)
-                    logger.info(f"Copied {src} -> {dest}")
-                    self.output_signal.emit(f"Copied {src} -> {dest}")
-                elif os.path.isdir(src):
-                    shutil.copytree(src, dest, dirs_exist_ok=True)
-                    logger.info(f"Copied {src} -> {dest}")
-                    self.output_signal.emit(f"Copied {src} -> {dest}")
+        # Entries whose destinations can overlap share a first path component,
+        # those run in entry order on one worker so the last entry still wins
+        groups: dict[str, list[tuple[str, str]]] = {}
+        for src, dest in tasks:
+            top = self.copy_group_key(dest, output_dir)
+            groups.setdefault(top, []).append((src, dest))
+        if "" in groups:
+            # An entry copied onto the output root overlaps every other entry
+            groups = {"": tasks}
+
+        # Groups are I/O bound and independent, overlap them
+        workers = max(1, min(COPY_WORKERS, len(groups)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.copy_group, group, cancel)
+                for group in groups.values()
+            ]
+            for future in as_completed(futures):
+                failure = future.result()
+                if cancel.is_set():
+                    executor.shutdown(cancel_futures=True)
+                    return
+                if failure:
+                    src, dest, e = failure
+                    logger.error(f"Failed to copy {src} -> {dest}: {e}")
+                    self.error_signal.emit(f"Failed to copy {src} -> {dest}: {e}")
+                    cancel.set()
+                    executor.shutdown(cancel_futures=True)
+                    return
+
+        if cancel.is_set():
+            return
+        logger.info("All external sources copied successfully.")
+        self.copy_finished_signal.emit()
 
+    @staticmethod
+    def copy_group_key(dest: str, output_dir: str) -> str:
+        """
+        Return the normalized first path component of dest below output_dir.
+        The output root itself gives "", and every destination outside of
+        output_dir, e.g. on another drive, shares OUTSIDE_GROUP_KEY.
+        """
+        root = os.path.normcase(os.path.normpath(output_dir))
+        path = os.path.normcase(os.path.normpath(dest))
+        if path == root:
+            return ""
+        # Compared by prefix, relpath raises for a path on another drive
+        prefix = os.path.join(root, "")
+        same_drive = os.path.splitdrive(path)[0] == os.path.splitdrive(root)[0]
+        if not same_drive or not path.startswith(prefix):
+            return OUTSIDE_GROUP_KEY
+        return path[len(prefix) :].split(os.sep, 1)[0]
+
+    def copy_group(
+        self, group: list[tuple[str, str]], cancel: threading.Event
+    ) -> tuple[str, str, Exception] | None:
+        """
+        Copy the entries of one destination group in order on a worker thread.
+        Returns the failed entry and its error, or None.
+        """
+        for src, dest in group:
+            if cancel.is_set():
+                return None
+            try:
+                self.copy_source(src, dest)
             except Exception as e:
-                logger.error(f"Failed to copy {src} -> {dest}: {e}")
-                self.error_signal.emit(f"Failed to copy {src} -> {dest}: {e}")
-                return
+                return src, dest, e
+            logger.info(f"Copied {src} -> {dest}")
+            self.output_signal.emit(f"Copied {src} -> {dest}")
+        return None
 
-        logger.info("All external sources copied successfully.")
-        self.process_finished()  # Trigger the next step after copying sources
+    @staticmethod
+    def copy_source(src: str, dest: str) -> None:
+        """
+        Copy one external file or folder, run on a worker thread.
+        """
+        if os.path.isfile(src):
+            QtCompiler.copy_file(src, dest)
+        else:
+            QtCompiler.copy_tree(src, dest)
+
+    @staticmethod
+    def copy_tree(src: str, dest: str) -> None:
+        """
+        Copy a folder recursively, through multithreaded robocopy on Windows.
+        """
+        if sys.platform != "win32":
+            shutil.copytree(
+                src, dest, copy_function=QtCompiler.copy_file, dirs_exist_ok=True
+            )
+            return
+
+        result = subprocess.run(
+            ["robocopy", src, dest, "/E", f"/MT:{ROBOCOPY_THREADS}", *ROBOCOPY_QUIET],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=subprocess.CREATE_NO_WINDOW,
+        )
+        # Exit codes below 8 report what was copied, 8 and above are failures
+        if result.returncode >= 8:
+            raise OSError(f"robocopy failed with exit code {result.returncode}")
+
+    @staticmethod
+    def copy_file(src: str, dest: str) -> str:
+        """
+        Copy a file with its metadata, through CopyFileExW on Windows.
+        """
+        if COPY_FILE_EX is None:
+            return shutil.copy2(src, dest)
+
+        flags = 0
+        if os.path.getsize(src) > NO_BUFFERING_THRESHOLD:
+            flags = COPY_FILE_NO_BUFFERING
+        if not COPY_FILE_EX(src, dest, None, None, None, flags):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return dest
 
     def clean_build_files(self) -> None:
         """
@@ -296,41 +744,73 @@ class QtCompiler(QObject):
             return
 
         # Traverse release/debug directories
-        config_dir = "release" if self.is_release else "debug"
-        build_dir = os.path.join(self.output_path, config_dir)
+        build_dir = self._build_dir
+        if not os.path.isdir(build_dir):
+            return
+
+        # Single directory pass, case-insensitive like glob on Windows
+        with os.scandir(build_dir) as entries:
+            paths = [
+                entry.path
+                for entry in entries
+                if entry.name.lower().endswith(CLEAN_EXTENSIONS)
+                and entry.is_file(follow_symlinks=False)
+            ]
 
-        patterns = ["*.cpp", "*.c", "*.o"]
         removed_files = 0
 
-        for pattern in patterns:
-            for file_path in glob.glob(os.path.join(build_dir, pattern)):
-                try:
-                    os.remove(file_path)
+        # Deletes are latency bound, overlap them and report from this thread
+        workers = max(1, min(CLEAN_WORKERS, len(paths)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for path, error in zip(paths, executor.map(self.remove_file, paths)):
+                if error is None:
                     removed_files += 1
-                except Exception as e:
-                    logger.error(f"Could not delete {file_path}: {e}")
-                    self.output_signal.emit(
-                        f"[Error] Could not delete {file_path}: {e}\n"
-                    )
+                    continue
+                logger.error(f"Could not delete {path}: {error}")
+                self.output_signal.emit(
+                    f"{ERROR_LINE_PREFIX}Could not delete {path}: {error}\n"
+                )
 
         logger.info(f"Cleaned {removed_files} build artifact files.")
         self.output_signal.emit(f"Cleaned {removed_files} build artifact files.\n")
 
+    @staticmethod
+    def remove_file(path: str) -> OSError | None:
+        """
+        Delete one file on a worker thread, returning the error instead of raising.
+        """
+        try:
+            os.remove(path)
+        except OSError as e:
+            return e
+        return None
+
     def stop_process(self) -> None:
         """
         Stop the current process if it is running.
         """
-        if self.process is not None:
-            self.process.kill()
-            logger.info("Build process stopped by user.")
-            self.error_signal.emit(
-                '<span style="color:red; font-weight:bold;">Build stopped by user</span>'
-            )
+        running = self.process.state() != QProcess.ProcessState.NotRunning
+        copying = self._copy_thread is not None and self._copy_thread.is_alive()
+        # Also when the copy thread is gone, its finished signal may still be queued
+        self._copy_cancel.set()
+        if self._stage == Stage.COPY_SOURCES:
+            self._stage = Stage.DONE
+        if not running and not copying and not self._qml_processes:
+            return
 
-    @staticmethod
-    def _dict_to_qt_env(env_dict: dict) -> QProcessEnvironment:
-        """Convert Python dictionary to QProcessEnvironment"""
-        qt_env = QProcessEnvironment()
-        for k, v in env_dict.items():
-            qt_env.insert(k, v)
-        return qt_env
+        self.stop_qml_deploys()
+        if running and sys.platform == "win32":
+            # kill() only ends the top process, take its compiler children down too
+            subprocess.run(
+                ["taskkill", "/T", "/F", "/PID", str(self.process.processId())],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=subprocess.CREATE_NO_WINDOW,
+            )
+        elif running:
+            self.process.terminate()
+            if not self.process.waitForFinished(STOP_TIMEOUT):
+                self.process.kill()
+        self.flush_output(final=True)
+        logger.info("Build process stopped by user.")
+        self.error_signal.emit(STOPPED_HTML)
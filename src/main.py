@@ -19,15 +19,18 @@ import os
 import sys
 import subprocess
 import re
-import threading
 import __main__
 import json
+import stat
+import string
+import html as htmllib
 import ctypes
+from functools import lru_cache, partial
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 
-from PyQt6.QtCore import pyqtSignal, pyqtSlot, Qt, QEvent
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, Qt, QThreadPool, QTimer, QUrl
 from PyQt6.QtWidgets import (
     QApplication,
     QFileDialog,
@@ -35,7 +38,7 @@ from PyQt6.QtWidgets import (
     QTableWidgetItem,
     QSystemTrayIcon,
 )
-from PyQt6.QtGui import QTextDocument, QIcon
+from PyQt6.QtGui import QIcon, QDesktopServices
 
 from qfluentwidgets import FluentIcon as FIF
 from qfluentwidgets import (
@@ -46,9 +49,57 @@ from qfluentwidgets import (
     TeachingTipTailPosition,
 )
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+src_path = os.path.dirname(os.path.abspath(__file__))
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 from UI.ui_main import MainUI
-from compiler import QtCompiler
+from compiler import QtCompiler, ERROR_LINE_PREFIX
+
+# Version folder of the Qt installer layout, e.g. C:\Qt\5.15.2\mingw81_64
+QT_VERSION_DIR_PATTERN = re.compile(r"^\d+\.\d+(\.\d+)?$")
+
+# Markup stripped from info bar messages without building a QTextDocument
+HTML_BREAK_PATTERN = re.compile(r"<br\s*/?>", re.IGNORECASE)
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+# Deletes the allowed half-width characters: English letters, numbers and _ / \ : . -
+ENGLISH_PATH_TABLE = str.maketrans(
+    "", "", string.ascii_letters + string.digits + "_:/\\.-"
+)
+
+# Version line of mkspecs/qconfig.pri, e.g. QT_VERSION = 5.15.2
+QCONFIG_VERSION_PATTERN = re.compile(r"^QT_VERSION\s*=\s*(\S+)", re.MULTILINE)
+
+# Prefixes of the compiler folders inside a Qt version folder, in any casing
+VALID_COMPILER_PATTERN = re.compile(r"mingw|msvc", re.IGNORECASE)
+
+# Compiler, linker and make diagnostics: "error:", "error C2065", "Error 1"
+ERROR_LINE_PATTERN = re.compile(r"\berror\b(?:\s*:|\s+[A-Z]*\d)", re.IGNORECASE)
+
+# Terminal markup of output lines, filled in with str.format on escaped text
+OUTPUT_LINE_HTML = '<span style="white-space:pre;">{}</span>'
+OUTPUT_ERROR_HTML = (
+    '<span style="color:orange; font-weight:bold; white-space:pre;">[Error] {}</span>'
+)
+ERROR_HTML = '<span style="color:red; font-weight:bold;">[Error] {}</span>'
+FINISHED_HTML = (
+    '<span style="color:green; font-weight:bold;">Packaging finished!</span>'
+)
+
+# Interval in ms for batching terminal appends into one repaint
+TERMINAL_FLUSH_INTERVAL = 33
+
+# Threads running qmake -v at once for folders without a version name
+SCAN_WORKERS = 4
+
+# Version line of qmake -v, e.g. Using Qt version 5.15.2 in C:/Qt/5.15.2/mingw81_64/lib
+QMAKE_VERSION_PATTERN = re.compile(rb"Using Qt version (\S+)")
+
+# Seconds a qmake -v probe may take before the folder is reported as invalid
+QMAKE_TIMEOUT = 5
+
+# Keeps the probed console tools from creating a console window
+CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
 
 
 # Logger
@@ -93,6 +144,9 @@ sys.excepthook = exception_handler
 
 class QtPackage(QWidget):
     emit_operation_status = pyqtSignal(int, str, int)
+    # Emitted from the scan worker, queued over to the GUI thread
+    qt_version_found = pyqtSignal(str, str)
+    scan_finished = pyqtSignal(dict, dict)
 
     def __init__(self):
         """
@@ -104,8 +158,11 @@ class QtPackage(QWidget):
 
         self.ui = MainUI()
         self.compiler = QtCompiler()
+        # Pages and widgets reached on every slot, bound once
+        self._settings = self.ui.qt_package_settings
+        self._project = self.ui.qt_package_project
+        self._terminal = self._project.package_terminal
 
-        self.VALID_COMPILERS = ("mingw", "msvc")
         self.qt_compiler = {}
         self.qt_mingw = {}
         self.qt_dependencies = {}
@@ -115,10 +172,24 @@ class QtPackage(QWidget):
         self.qt_project_file_path = ""
         self.qt_project_output_path = ""
         self.is_compiling = False
+        # Compiling state the toggle button and settings page currently show
+        self._ui_compiling = False
+
+        # One file dialog for every selection, created on first use
+        self._file_dialog: QFileDialog | None = None
+        self._dialog_dirs: dict[str, str] = {}
+
+        # Terminal lines waiting for the next batched repaint
+        self._terminal_buffer: list[str] = []
+        self._terminal_timer = QTimer(self)
+        self._terminal_timer.setSingleShot(True)
+        self._terminal_timer.setInterval(TERMINAL_FLUSH_INTERVAL)
+        self._terminal_timer.timeout.connect(self.flush_terminal)
 
         self.set_connection()
         self.load_qt_dependencies()
-        self.scan_qt_path()
+        # Scan once the event loop runs, the window is shown before any disk access
+        QTimer.singleShot(0, self.scan_qt_path)
 
         logger.info("Program initialized")
         self.highlight_taskbar()
@@ -128,41 +199,31 @@ class QtPackage(QWidget):
         Connect signals and slots for the UI elements.
         """
         self.emit_operation_status.connect(self.info_bar)
+        self.qt_version_found.connect(self.add_qt_version)
+        self.scan_finished.connect(self.refresh_qt_version_combobox)
 
         # Qt Packager Settings UI
-        self.ui.qt_package_settings.env_button.clicked.connect(self.select_qt_folder)
-        self.ui.qt_package_settings.project_button.clicked.connect(
-            self.select_qt_project_file
-        )
-        self.ui.qt_package_settings.env_qt_version_combo_box.currentTextChanged.connect(
+        self._settings.env_button.clicked.connect(self.select_qt_folder)
+        self._settings.project_button.clicked.connect(self.select_qt_project_file)
+        self._settings.env_qt_version_combo_box.currentTextChanged.connect(
             self.qt_compiler_selection_changed
         )
-        self.ui.qt_package_settings.env_qt_mingw_combo_box.currentTextChanged.connect(
+        self._settings.env_qt_mingw_combo_box.currentTextChanged.connect(
             self.qt_mingw_selection_changed
         )
 
-        self.ui.qt_package_settings.output_path_button.clicked.connect(
-            self.select_output_directory
-        )
-        self.ui.qt_package_project.package_toggle_button.clicked.connect(
-            self.packaging_toggle
-        )
-        self.ui.qt_package_project.package_folder_button.clicked.connect(
-            self.open_build_folder
-        )
-        self.ui.qt_package_settings.external_file_button.clicked.connect(
-            self.include_external_files
-        )
-        self.ui.qt_package_settings.external_folder_button.clicked.connect(
+        self._settings.output_path_button.clicked.connect(self.select_output_directory)
+        self._project.package_toggle_button.clicked.connect(self.packaging_toggle)
+        self._project.package_folder_button.clicked.connect(self.open_build_folder)
+        self._settings.external_file_button.clicked.connect(self.include_external_files)
+        self._settings.external_folder_button.clicked.connect(
             self.include_external_folder
         )
-        self.ui.qt_package_settings.external_remove_button.clicked.connect(
-            self.delete_selected_rows
-        )
-        self.ui.qt_package_settings.dependencies_remove_button.clicked.connect(
+        self._settings.external_remove_button.clicked.connect(self.delete_selected_rows)
+        self._settings.dependencies_remove_button.clicked.connect(
             self.delete_selected_rows
         )
-        self.ui.qt_package_settings.dependencies_import_button.clicked.connect(
+        self._settings.dependencies_import_button.clicked.connect(
             self.import_dependencies
         )
 
@@ -196,60 +257,102 @@ class QtPackage(QWidget):
             logger.error(f"Error loading Qt dependencies: {e}")
             self.qt_dependencies = {}
 
-    def is_qt_compiler_dir(self, path: str) -> bool:
+    def is_qt_compiler_dir(self, path: str, dir_name: str | None = None) -> bool:
         """
         Check if the given path is a valid Qt compiler directory.
+        dir_name, if given, is the already known folder name of path.
         """
-        dir_name = os.path.basename(path).lower()
-        if not dir_name.startswith(self.VALID_COMPILERS):
+        # Matched in place, no lowered copy of the name
+        if not VALID_COMPILER_PATTERN.match(dir_name or os.path.basename(path)):
             return False
         qmake_path = os.path.join(path, "bin", "qmake.exe")
-        return os.path.exists(qmake_path)
+        return os.path.isfile(qmake_path)
 
-    def get_qt_info(self, compiler_path: str) -> str:
+    @staticmethod
+    def get_qt_info(
+        compiler_path: str, compiler_name: str | None = None, version_dir: str = ""
+    ) -> str:
         """
-        Execute qmake -v to get Qt version and compiler information
+        Get the Qt version and compiler information of a compiler directory.
+        compiler_name and version_dir, if given, are the already known folder names.
         """
-        qmake_path = os.path.join(compiler_path, "bin", "qmake.exe")
         try:
-            result = subprocess.run(
-                [qmake_path, "-v"], capture_output=True, text=True, check=True
-            )
-            output = result.stdout
-            # Output example:
-            # QMake version 3.1
-            # Using Qt version 5.15.2 in C:/Qt/5.15.2/msvc2019_64/lib
-            lines = output.splitlines()
-            qt_line = next((line for line in lines if "Using Qt version" in line), "")
-            qt_version = qt_line.split(" ")[3] if qt_line else "Unknown"
-            compiler_name = os.path.basename(compiler_path)
-            logger.info(f"Detected Qt version: {qt_version} in {compiler_name}")
-            return f"Qt {qt_version} ({compiler_name})"
+            return QtPackage.read_qt_info(compiler_path, compiler_name, version_dir)
         except Exception as e:
             logger.warning(f"Invalid Qt info: {e}")
-            return f"{os.path.basename(compiler_path)} (invalid qmake)"
+            compiler_name = compiler_name or os.path.basename(compiler_path)
+            return f"{compiler_name} (invalid qmake)"
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def read_qt_info(
+        compiler_path: str, compiler_name: str | None = None, version_dir: str = ""
+    ) -> str:
+        """
+        Read the Qt version of a compiler directory from the installer layout
+        (C:\\Qt\\<version>\\<compiler>) or mkspecs/qconfig.pri, and only fall back
+        to executing qmake -v without both. A failed qmake raises, so it is not
+        cached and the next scan probes it again.
+        """
+        compiler_name = compiler_name or os.path.basename(compiler_path)
+        version_dir = version_dir or os.path.basename(os.path.dirname(compiler_path))
+        if QT_VERSION_DIR_PATTERN.match(version_dir):
+            logger.debug(f"Detected Qt version: {version_dir} in {compiler_name}")
+            return f"Qt {version_dir} ({compiler_name})"
+
+        # Every Qt build records its version in qconfig.pri, a read beats a process
+        qconfig_path = os.path.join(compiler_path, "mkspecs", "qconfig.pri")
+        try:
+            with open(qconfig_path, encoding="utf-8", errors="replace") as f:
+                match = QCONFIG_VERSION_PATTERN.search(f.read())
+        except OSError:
+            match = None
+        if match:
+            qt_version = match.group(1)
+            logger.debug(f"Detected Qt version: {qt_version} in {compiler_name}")
+            return f"Qt {qt_version} ({compiler_name})"
+
+        qmake_path = os.path.join(compiler_path, "bin", "qmake.exe")
+        result = subprocess.run(
+            [qmake_path, "-v"],
+            capture_output=True,
+            check=True,
+            creationflags=CREATE_NO_WINDOW,
+            timeout=QMAKE_TIMEOUT,
+        )
+        # Searched as bytes, only the version itself is decoded
+        match = QMAKE_VERSION_PATTERN.search(result.stdout)
+        qt_version = match.group(1).decode() if match else "Unknown"
+        logger.debug(f"Detected Qt version: {qt_version} in {compiler_name}")
+        return f"Qt {qt_version} ({compiler_name})"
 
     def scan_qt_path(self, folder: str = "C:\\Qt") -> None:
         """
         Scan the specified folder for Qt installations.
         """
         logger.info(f"Scanning: {folder}")
-        self.ui.qt_package_settings.env_button.setDisabled(True)
-        self.ui.qt_package_settings.env_button.setText("Scanning...")
-        QApplication.processEvents()
-        thread = threading.Thread(target=self.scan_qt_path_thread, args=(folder,))
-        thread.start()
+        self._settings.env_button.setDisabled(True)
+        self._settings.env_button.setText("Scanning...")
+        # Versions are added one by one as the scan finds them
+        self.qt_compiler = {}
+        self._settings.env_qt_version_combo_box.clear()
+        QThreadPool.globalInstance().start(partial(self.scan_qt_path_thread, folder))
 
     def scan_qt_path_thread(self, folder) -> None:
         """
         Worker thread for scanning the Qt installation path.
         """
-        qt_versions = self.find_qt_versions(folder)
+        qt_versions = self.find_qt_versions(folder, self.qt_version_found.emit)
         qt_mingw = self.find_qt_mingw_compilers(folder)
+        self.scan_finished.emit(qt_versions, qt_mingw)
 
-        QApplication.instance().postEvent(
-            self, ScanFinishedEvent(qt_versions, qt_mingw)
-        )
+    @pyqtSlot(str, str)
+    def add_qt_version(self, display_name: str, qmake_path: str) -> None:
+        """
+        Add a found Qt version to the Qt version combo box.
+        """
+        self.qt_compiler[display_name] = qmake_path
+        self._settings.env_qt_version_combo_box.addItem(display_name)
 
     def find_qt_mingw_compilers(self, path: str) -> dict:
         """
@@ -258,105 +361,102 @@ class QtPackage(QWidget):
         qt_mingw: { "display_name": qmake_path }
         """
         qt_mingw = {}
-        tools_dir = Path(path) / "Tools"
-        if not tools_dir.is_dir():
+        tools_dir = os.path.join(path, "Tools")
+        if not os.path.isdir(tools_dir):
             return qt_mingw
 
-        mingw_dirs = [
-            d
-            for d in tools_dir.iterdir()
-            if d.is_dir() and d.name.lower().startswith("mingw")
-        ]
-
-        def check_mingw(mingw_dir: Path):
-            bin_dir = mingw_dir / "bin"
-            gpp_path = bin_dir / "g++.exe"
-            make_path = bin_dir / "mingw32-make.exe"
-
-            if gpp_path.is_file() and make_path.is_file():
-                arch = "64-bit" if "64" in mingw_dir.name else "32-bit"
-                display_name = f"{mingw_dir.name} ({arch})"
-                return display_name, str(bin_dir)
-            return None
-
-        with ThreadPoolExecutor() as executor:
-            futures = [executor.submit(check_mingw, d) for d in mingw_dirs]
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    display_name, bin_dir = result
-                    qt_mingw[display_name] = bin_dir
+        # A handful of folders and two stats each, cheaper inline than on a pool
+        with os.scandir(tools_dir) as entries:
+            for entry in entries:
+                if not (entry.name.lower().startswith("mingw") and entry.is_dir()):
+                    continue
+                bin_dir = os.path.join(entry.path, "bin")
+                gpp_path = os.path.join(bin_dir, "g++.exe")
+                make_path = os.path.join(bin_dir, "mingw32-make.exe")
+                if os.path.isfile(gpp_path) and os.path.isfile(make_path):
+                    arch = "64-bit" if "64" in entry.name else "32-bit"
+                    qt_mingw[f"{entry.name} ({arch})"] = bin_dir
 
         logger.info(f"Detected MinGW compilers: {qt_mingw}")
         return qt_mingw
 
-    def find_qt_versions(self, path: str) -> dict:
+    def find_qt_versions(self, path: str, on_found=None) -> dict:
         """
         Scan the Qt installation directory and populate the env_combo_box,
         while saving the dictionary mapping:
         qt_dict: { "display_name": compiler_path }
+        on_found, if given, is called with each version as soon as it is probed.
         """
         qt_compiler = {}
-        path = Path(path)
-        if not path.is_dir():
+        if not os.path.isdir(path):
             return qt_compiler
 
+        # DirEntry caches the entry type from the listing, no stat per entry
         candidates = []
-        for version in os.listdir(path):
-            version_path = path / version
-            if version_path.is_dir() and version[0].isdigit():
-                for compiler in os.listdir(version_path):
-                    compiler_path = version_path / compiler
-                    if compiler_path.is_dir():
-                        candidates.append(compiler_path)
-
-        def check_compiler(compiler_path: Path):
-            if self.is_qt_compiler_dir(compiler_path):
-                display_name = self.get_qt_info(compiler_path)
-                qmake_path = compiler_path / "bin"
-                return display_name, str(qmake_path)
-            return None
-
-        with ThreadPoolExecutor() as executor:
-            futures = [executor.submit(check_compiler, c) for c in candidates]
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    display_name, qmake_path = result
-                    qt_compiler[display_name] = qmake_path
+        with os.scandir(path) as versions:
+            for version in versions:
+                if not (version.name[:1].isdigit() and version.is_dir()):
+                    continue
+                with os.scandir(version.path) as compilers:
+                    candidates.extend(
+                        (c.path, c.name, version.name) for c in compilers if c.is_dir()
+                    )
+        # Listing order is up to the file system, keep the combo box stable
+        candidates.sort()
+
+        def add_compiler(display_name: str, compiler_path: str) -> None:
+            qmake_path = os.path.join(compiler_path, "bin")
+            qt_compiler[display_name] = qmake_path
+            if on_found:
+                on_found(display_name, qmake_path)
+
+        # Folders named after their version need no qmake launch, resolve them inline
+        probes = []
+        for compiler_path, compiler_name, version_dir in candidates:
+            if not self.is_qt_compiler_dir(compiler_path, compiler_name):
+                continue
+            if QT_VERSION_DIR_PATTERN.match(version_dir):
+                display_name = self.get_qt_info(
+                    compiler_path, compiler_name, version_dir
+                )
+                add_compiler(display_name, compiler_path)
+            else:
+                probes.append((compiler_path, compiler_name, version_dir))
+
+        # The remaining probes may have to launch qmake, overlap them
+        if probes:
+            workers = min(SCAN_WORKERS, len(probes))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # map yields in submission order, so the sorted order is kept
+                display_names = executor.map(self.get_qt_info, *zip(*probes))
+                for display_name, probe in zip(display_names, probes):
+                    add_compiler(display_name, probe[0])
 
         logger.info(f"Detected Qt compilers: {qt_compiler}")
         return qt_compiler
 
+    @pyqtSlot(dict, dict)
     def refresh_qt_version_combobox(self, qt_versions, qt_mingw) -> None:
         """
         Refresh the Qt version and MinGW combo boxes.
         """
         self.qt_compiler = qt_versions
         self.qt_mingw = qt_mingw
-        self.ui.qt_package_settings.env_qt_version_combo_box.clear()
-        self.ui.qt_package_settings.env_qt_mingw_combo_box.clear()
+        settings = self._settings
+        mingw_combo_box = settings.env_qt_mingw_combo_box
+        mingw_combo_box.clear()
 
-        if qt_versions:
-            for display_name, path in qt_versions.items():
-                self.ui.qt_package_settings.env_qt_version_combo_box.addItem(
-                    display_name
-                )
-        else:
-            self.ui.qt_package_settings.env_qt_version_combo_box.setPlaceholderText(
-                "No Qt Found"
-            )
+        # The versions themselves were already added by add_qt_version
+        if not qt_versions:
+            settings.env_qt_version_combo_box.setPlaceholderText("No Qt Found")
 
         if qt_mingw:
-            for display_name, path in qt_mingw.items():
-                self.ui.qt_package_settings.env_qt_mingw_combo_box.addItem(display_name)
+            mingw_combo_box.addItems(qt_mingw.keys())
         else:
-            self.ui.qt_package_settings.env_qt_mingw_combo_box.setPlaceholderText(
-                "No MinGW Found"
-            )
+            mingw_combo_box.setPlaceholderText("No MinGW Found")
 
-        self.ui.qt_package_settings.env_button.setDisabled(False)
-        self.ui.qt_package_settings.env_button.setText("Browse...")
+        settings.env_button.setDisabled(False)
+        settings.env_button.setText("Browse...")
 
     def detect_qt_major_version(self, qt_path: str) -> int:
         """
@@ -378,16 +478,50 @@ class QtPackage(QWidget):
 
         return int(version_str.split(".")[0])
 
+    def select_paths(
+        self,
+        kind: str,
+        title: str,
+        file_mode: QFileDialog.FileMode,
+        name_filter: str = "All Files (*)",
+        options: QFileDialog.Option = QFileDialog.Option(0),
+    ) -> list[str]:
+        """
+        Show the shared file dialog and return the selected paths.
+        Each kind of selection reopens in the folder it was last used in.
+        """
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self.ui)
+        dialog = self._file_dialog
+        dialog.setWindowTitle(title)
+        dialog.setFileMode(file_mode)
+        dialog.setOptions(options)
+        dialog.setNameFilter(name_filter)
+        dialog.setDirectory(self._dialog_dirs.get(kind, ""))
+        if not dialog.exec():
+            return []
+
+        paths = dialog.selectedFiles()
+        self._dialog_dirs[kind] = dialog.directory().absolutePath()
+        return paths
+
+    def select_path(self, *args, **kwargs) -> str:
+        """
+        Single-selection form of select_paths, empty if the dialog was canceled.
+        """
+        paths = self.select_paths(*args, **kwargs)
+        return paths[0] if paths else ""
+
     @pyqtSlot()
     def select_qt_folder(self) -> None:
         """
         Open a file dialog to select the Qt installation folder.
         """
-        folder = QFileDialog.getExistingDirectory(
-            self.ui,
+        folder = self.select_path(
+            "qt",
             "Select Qt Installation Folder",
-            "",
-            QFileDialog.Option.ShowDirsOnly,
+            QFileDialog.FileMode.Directory,
+            options=QFileDialog.Option.ShowDirsOnly,
         )
         if folder:
             logger.info(f"User selected Qt folder: {folder}")
@@ -398,10 +532,10 @@ class QtPackage(QWidget):
         """
         Open a file dialog to select a Qt project file (.pro).
         """
-        file_path, _ = QFileDialog.getOpenFileName(
-            self.ui,
+        file_path = self.select_path(
+            "project",
             "Select Qt Project File",
-            "",
+            QFileDialog.FileMode.ExistingFile,
             "Qt Project Files (*.pro)",
         )
         if not self.is_english_path(file_path):
@@ -415,7 +549,7 @@ class QtPackage(QWidget):
 
         if file_path:
             logger.info(f"User selected project: {file_path}")
-            self.ui.qt_package_settings.project_select_edit.setText(file_path)
+            self._settings.project_select_edit.setText(file_path)
             self.qt_project_file_path = file_path
 
     @pyqtSlot(str)
@@ -428,9 +562,11 @@ class QtPackage(QWidget):
             logger.info(f"User selected Qt compiler path: {compiler_path}")
             self.compiler_path = compiler_path
 
-            self.ui.qt_package_settings.dependencies_module_combo_box.clear()
-            self.ui.qt_package_settings.dependencies_table.clear()
-            self.ui.qt_package_settings.dependencies_table.setHorizontalHeaderLabels(
+            module_combo_box = self._settings.dependencies_module_combo_box
+            dependencies_table = self._settings.dependencies_table
+            module_combo_box.clear()
+            dependencies_table.clear()
+            dependencies_table.setHorizontalHeaderLabels(
                 [
                     "Module Name",
                     "Module Type",
@@ -444,9 +580,7 @@ class QtPackage(QWidget):
                     compiler_path, self.qt_dependencies, module_name
                 )
                 if exists:
-                    self.ui.qt_package_settings.dependencies_module_combo_box.addItem(
-                        module_name
-                    )
+                    module_combo_box.addItem(module_name)
 
     @pyqtSlot(str)
     def qt_mingw_selection_changed(self, text: str) -> None:
@@ -474,10 +608,11 @@ class QtPackage(QWidget):
         """
         if module_name not in qt_config:
             logger.warning(f"Module '{module_name}' not found in config.")
-            return False
+            return False, "", "", "", ""
 
-        qt_major = self.detect_qt_major_version(qt_bin_path)
-        qt_dir = Path(qt_bin_path).parent.resolve()
+        qt_major = str(self.detect_qt_major_version(qt_bin_path))
+        # Plain strings: this runs for every known module on each compiler change
+        qt_dir = os.path.realpath(os.path.dirname(os.path.normpath(qt_bin_path)))
 
         module_config = qt_config[module_name]
         module_type = module_config.get("type")
@@ -485,55 +620,51 @@ class QtPackage(QWidget):
         path_template = module_config.get("path", "")
         dest_path = module_config.get("dest_path", "")
 
-        dll = Path(
-            dll_template.replace("%QTDIR%", str(qt_dir)).replace(
-                "{QT_MAJOR}", str(qt_major)
-            )
+        dll = os.path.normpath(
+            dll_template.replace("%QTDIR%", qt_dir).replace("{QT_MAJOR}", qt_major)
         )
 
-        dll_exists = dll.is_file()
+        dll_exists = os.path.isfile(dll)
         if dll_exists:
-            logger.info(f"DLL found: {dll}")
+            logger.debug(f"DLL found: {dll}")
         else:
-            logger.info(f"Invalid Module {module_name}, DLL not found: {dll}")
-            return False, str(dll), "", ""
+            logger.debug(f"Invalid Module {module_name}, DLL not found: {dll}")
+            return False, "", dll, "", ""
 
         if path_template:
-            path = Path(
-                path_template.replace("%QTDIR%", str(qt_dir)).replace(
-                    "{QT_MAJOR}", str(qt_major)
-                )
+            path = os.path.normpath(
+                path_template.replace("%QTDIR%", qt_dir).replace("{QT_MAJOR}", qt_major)
             )
-            path_exists = path.is_dir()
+            path_exists = os.path.isdir(path)
             if path_exists:
-                logger.info(f"Path found: {path}")
+                logger.debug(f"Path found: {path}")
             else:
-                logger.info(f"Path not found: {path}")
+                logger.debug(f"Path not found: {path}")
         else:
-            logger.info(f"No extra directories are needed for this DLL: {dll}")
+            logger.debug(f"No extra directories are needed for this DLL: {dll}")
             path_exists = True
             path = ""
 
         return (
             dll_exists and path_exists,
             str(module_type),
-            str(dll),
-            str(path),
+            dll,
+            path,
             str(dest_path),
         )
 
     @pyqtSlot()
     def import_dependencies(self) -> None:
-        module_name = (
-            self.ui.qt_package_settings.dependencies_module_combo_box.currentText()
-        )
+        module_name = self._settings.dependencies_module_combo_box.currentText()
 
         exists, type, dll, path, dest_path = self.validate_qt_module_info(
             self.compiler_path, self.qt_dependencies, module_name
         )
         if exists:
-            for row in range(self.ui.qt_package_settings.dependencies_table.rowCount()):
-                item = self.ui.qt_package_settings.dependencies_table.item(row, 0)
+            dependencies_table = self._settings.dependencies_table
+            row = dependencies_table.rowCount()
+            for existing_row in range(row):
+                item = dependencies_table.item(existing_row, 0)
                 if item and item.text() == module_name:
                     logger.info(f"Module '{module_name}' already in the table.")
                     self.emit_operation_status.emit(
@@ -543,39 +674,21 @@ class QtPackage(QWidget):
                     )
                     return
 
-            row = self.ui.qt_package_settings.dependencies_table.rowCount()
-            self.ui.qt_package_settings.dependencies_table.insertRow(row)
-
-            module = QTableWidgetItem(module_name)
-            module.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.ui.qt_package_settings.dependencies_table.setItem(row, 0, module)
-
-            type_item = QTableWidgetItem(type)
-            type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.ui.qt_package_settings.dependencies_table.setItem(row, 1, type_item)
-
-            dll_path = QTableWidgetItem(dll)
-            dll_path.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.ui.qt_package_settings.dependencies_table.setItem(row, 2, dll_path)
-
-            path_item = QTableWidgetItem(path)
-            path_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.ui.qt_package_settings.dependencies_table.setItem(row, 3, path_item)
-
-            dest_item = QTableWidgetItem(dest_path)
-            dest_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.ui.qt_package_settings.dependencies_table.setItem(row, 4, dest_item)
+            dependencies_table.insertRow(row)
+            for column, text in enumerate((module_name, type, dll, path, dest_path)):
+                dependencies_table.setItem(row, column, QTableWidgetItem(text))
 
     @pyqtSlot()
     def select_output_directory(self) -> None:
         """
         Open a dialog for the user to select a project output directory.
         """
-        dir_path = QFileDialog.getExistingDirectory(
-            self.ui,
+        dir_path = self.select_path(
+            "output",
             "Select Project Output Directory",
-            "",
-            QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks,
+            QFileDialog.FileMode.Directory,
+            options=QFileDialog.Option.ShowDirsOnly
+            | QFileDialog.Option.DontResolveSymlinks,
         )
 
         if not self.is_english_path(dir_path):
@@ -589,15 +702,15 @@ class QtPackage(QWidget):
 
         if dir_path:
             logger.info(f"User selected output directory: {dir_path}")
-            self.ui.qt_package_settings.output_path_edit.setText(dir_path)
+            self._settings.output_path_edit.setText(dir_path)
             self.qt_project_output_path = dir_path
 
-            if os.listdir(dir_path):  # Folder is not empty
+            if not self.is_folder_empty(dir_path):
                 logger.warning(
                     f"User selected a non-empty folder as output directory: {dir_path}"
                 )
                 TeachingTip.create(
-                    target=self.ui.qt_package_settings.output_path_edit,
+                    target=self._settings.output_path_edit,
                     icon=InfoBarIcon.WARNING,
                     title="Output Folder Not Empty",
                     content="To avoid packaging errors, it is recommended to use an empty folder.",
@@ -607,19 +720,19 @@ class QtPackage(QWidget):
                     parent=self,
                 )
 
+    def is_folder_empty(self, path: str) -> bool:
+        """
+        Check if the folder has no entries, reading at most one of them.
+        """
+        with os.scandir(path) as entries:
+            return next(entries, None) is None
+
     def is_english_path(self, path: str) -> bool:
         """
         Check if the path and its parent directories contain only English characters, numbers, and common symbols.
         """
-        # Allowed half-width characters: English uppercase and lowercase + numbers + _ / \ : . -
-        allowed_pattern = r"^[A-Za-z0-9_:/\\.-]+$"
-
-        # Convert the path to an absolute path and split it
-        path = Path(path).resolve()
-        for part in path.parts:
-            if not re.match(allowed_pattern, part):
-                return False
-        return True
+        # Absolute without touching the disk, nothing may remain after deletion
+        return not os.path.abspath(path).translate(ENGLISH_PATH_TABLE)
 
     @pyqtSlot()
     def packaging_toggle(self) -> None:
@@ -627,37 +740,21 @@ class QtPackage(QWidget):
         Start the packaging process using the selected Qt compiler and project file.
         """
         if not self.is_compiling:
-            compiler_text = (
-                self.ui.qt_package_settings.env_qt_version_combo_box.currentText()
-            )
-
-            if not self.compiler_path:
-                self.ui.qt_package_project.package_terminal.append(
-                    "No valid Qt compiler selected."
-                )
-                return
-
-            if not self.mingw_path:
-                self.ui.qt_package_project.package_terminal.append(
-                    "No valid MinGW path selected."
-                )
-                return
-
-            if not self.qt_project_file_path:
-                self.ui.qt_package_project.package_terminal.append(
-                    "No project file selected."
-                )
-                return
-
-            if not self.qt_project_output_path:
-                self.ui.qt_package_project.package_terminal.append(
-                    "No output directory selected."
-                )
-                return
+            # Report the first missing setting only
+            for value, message in (
+                (self.compiler_path, "No valid Qt compiler selected."),
+                (self.mingw_path, "No valid MinGW path selected."),
+                (self.qt_project_file_path, "No project file selected."),
+                (self.qt_project_output_path, "No output directory selected."),
+            ):
+                if not value:
+                    self._terminal.append(message)
+                    return
 
+            compiler_text = self._settings.env_qt_version_combo_box.currentText()
             try:
                 logger.info(f"Starting packaging with {compiler_text}...")
-                if os.listdir(self.qt_project_output_path):  # Folder is not empty
+                if not self.is_folder_empty(self.qt_project_output_path):
                     logger.warning(
                         f"User selected a non-empty folder as output directory: {self.qt_project_output_path}"
                     )
@@ -666,24 +763,24 @@ class QtPackage(QWidget):
                         "Output Folder Not Empty: To Avoid Packaging Errors, Recommended to Use an Empty Folder",
                         5000,
                     )
-                self.ui.qt_package_project.package_terminal.append(
-                    f"Starting packaging with {compiler_text}..."
-                )
+                self._terminal.append(f"Starting packaging with {compiler_text}...")
+                # Set first, a missing tool reports through handle_error right away
+                self.is_compiling = True
                 self.compiler.compile_qt_project(
                     self.qt_project_file_path,
                     self.compiler_path,
                     self.mingw_path,
                     self.qt_project_output_path,
                     self.extract_table_data(),
-                    self.ui.qt_package_settings.build_combo_box.currentText()
-                    == "Release",
-                    self.ui.qt_package_settings.clean_switch.isChecked(),
+                    self._settings.build_combo_box.currentText() == "Release",
+                    self._settings.clean_switch.isChecked(),
+                    self._settings.build_jobs_spin_box.value(),
                 )
-                self.is_compiling = True
 
             except Exception as e:
+                self.is_compiling = False
                 logger.error(f"Error occurred while packaging: {str(e)}")
-                self.ui.qt_package_project.package_terminal.append(
+                self._terminal.append(
                     f'<span style="color:red; font-weight:bold;">Error: {str(e)}</span>'
                 )
 
@@ -692,42 +789,80 @@ class QtPackage(QWidget):
             self.is_compiling = False
             self.compiler.stop_process()
 
-        self.ui.qt_package_project.package_toggle_button.setText(
-            "Stop Packaging" if self.is_compiling else "Start Packaging"
-        )
-        self.ui.qt_package_project.package_toggle_button.setIcon(
-            FIF.CLOSE if self.is_compiling else FIF.PLAY
-        )
-        self.ui.qt_package_settings.setDisabled(self.is_compiling)
-        self.ui.qt_package_project.package_folder_button.setDisabled(True)
+        self.set_compiling_state(self.is_compiling, folder_ready=False)
+
+    def set_compiling_state(
+        self, compiling: bool, folder_ready: bool | None = None
+    ) -> None:
+        """
+        Switch the toggle button and the settings page between idle and compiling.
+
+        folder_ready enables or disables the open folder button, None leaves it as is.
+        """
+        self.is_compiling = compiling
+        # A start that fails right away reports idle twice, skip the second restyle
+        update_toggle = compiling != self._ui_compiling
+        if not update_toggle and folder_ready is None:
+            return
+
+        # One relayout for the button and the settings page together
+        self.ui.setUpdatesEnabled(False)
+        if update_toggle:
+            self._ui_compiling = compiling
+            toggle_button = self._project.package_toggle_button
+            if compiling:
+                toggle_button.setText("Stop Packaging")
+                toggle_button.setIcon(FIF.CLOSE)
+            else:
+                toggle_button.setText("Start Packaging")
+                toggle_button.setIcon(FIF.PLAY)
+            self._settings.setDisabled(compiling)
+        if folder_ready is not None:
+            folder_button = self._project.package_folder_button
+            folder_button.setDisabled(not folder_ready)
+        self.ui.setUpdatesEnabled(True)
 
     @pyqtSlot(str)
     def handle_output(self, text: str) -> None:
         """
-        Handle normal output messages.
+        Handle normal output messages, one terminal line per output line.
+        Every line is escaped, so compiler text such as <QtCore> stays visible.
         """
-        if re.search(r"error", text, re.IGNORECASE):
-            self.ui.qt_package_project.package_terminal.append(
-                f'<span style="color:orange; font-weight:bold;">[Error] {text}</span>'
-            )
-        else:
-            self.ui.qt_package_project.package_terminal.append(text)
+        for line in text.removesuffix("\n").split("\n"):
+            marked = line.startswith(ERROR_LINE_PREFIX)
+            line = line.removeprefix(ERROR_LINE_PREFIX)
+            line = htmllib.escape(line.rstrip("\r"), quote=False)
+            if marked or ERROR_LINE_PATTERN.search(line):
+                self._terminal_buffer.append(OUTPUT_ERROR_HTML.format(line))
+            else:
+                self._terminal_buffer.append(OUTPUT_LINE_HTML.format(line))
+        if not self._terminal_timer.isActive():
+            self._terminal_timer.start()
+
+    @pyqtSlot()
+    def flush_terminal(self) -> None:
+        """
+        Append the buffered output to the terminal with a single repaint.
+        """
+        self._terminal_timer.stop()
+        if not self._terminal_buffer:
+            return
+        terminal = self._terminal
+        terminal.setUpdatesEnabled(False)
+        for text in self._terminal_buffer:
+            terminal.append(text)
+        self._terminal_buffer.clear()
+        terminal.setUpdatesEnabled(True)
 
     @pyqtSlot(Path)
     def handle_finished(self, build_dir: Path) -> None:
         """
         Handle compiler finished signal.
         """
-        self.is_compiling = False
         self.build_path = build_dir
-        self.ui.qt_package_project.package_toggle_button.setText(
-            "Stop Packaging" if self.is_compiling else "Start Packaging"
-        )
-        self.ui.qt_package_project.package_toggle_button.setIcon(
-            FIF.CLOSE if self.is_compiling else FIF.PLAY
-        )
-        self.ui.qt_package_settings.setDisabled(self.is_compiling)
-        self.ui.qt_package_project.package_folder_button.setDisabled(False)
+        self.set_compiling_state(False, folder_ready=True)
+        self.flush_terminal()
+        self._terminal.append(FINISHED_HTML)
         self.emit_operation_status.emit(1, "Packaging Finished", 2000)
         self.highlight_taskbar()
         self.tray_notification(
@@ -739,18 +874,9 @@ class QtPackage(QWidget):
         """
         Handle error messages.
         """
-        self.is_compiling = False
-        self.ui.qt_package_project.package_toggle_button.setText(
-            "Stop Packaging" if self.is_compiling else "Start Packaging"
-        )
-        self.ui.qt_package_project.package_toggle_button.setIcon(
-            FIF.CLOSE if self.is_compiling else FIF.PLAY
-        )
-        self.ui.qt_package_settings.setDisabled(self.is_compiling)
-
-        self.ui.qt_package_project.package_terminal.append(
-            f'<span style="color:red; font-weight:bold;">[Error] {msg}</span>'
-        )
+        self.set_compiling_state(False)
+        self.flush_terminal()
+        self._terminal.append(ERROR_HTML.format(msg))
         self.emit_operation_status.emit(0, msg, 2000)
 
     @pyqtSlot()
@@ -758,9 +884,20 @@ class QtPackage(QWidget):
         """
         Open the build folder in the file explorer.
         """
-        if self.build_path.exists() and self.build_path.is_dir():
+        # Nothing to open before the first successful build
+        if self.build_path and os.path.isdir(self.build_path):
             logger.info(f"Opening build folder: {self.build_path}")
-            subprocess.Popen(f'explorer "{self.build_path}"')
+            if sys.platform != "win32":
+                QDesktopServices.openUrl(QUrl.fromLocalFile(str(self.build_path)))
+                return
+            try:
+                # Shell API call, no command line for explorer to parse
+                os.startfile(self.build_path)
+            except OSError as e:
+                logger.error(f"Failed to open build folder: {e}")
+                self.emit_operation_status.emit(
+                    0, f"Failed to Open Build Folder: {self.build_path}", 2000
+                )
         else:
             logger.warning(f"Folder does not exist: {self.build_path}")
             self.emit_operation_status.emit(
@@ -772,7 +909,9 @@ class QtPackage(QWidget):
         """
         Include an external folder.
         """
-        folder_path = QFileDialog.getExistingDirectory(self.ui, "Select a Folder")
+        folder_path = self.select_path(
+            "external", "Select a Folder", QFileDialog.FileMode.Directory
+        )
         if folder_path:
             logger.info(f"User selected external folder to include: {folder_path}")
             self.add_external_path_to_table(folder_path)
@@ -782,54 +921,77 @@ class QtPackage(QWidget):
         """
         Include external files.
         """
-        file_paths, _ = QFileDialog.getOpenFileNames(self.ui, "Select Files")
+        file_paths = self.select_paths(
+            "external", "Select Files", QFileDialog.FileMode.ExistingFiles
+        )
         if file_paths:
-            for file_path in file_paths:
-                logger.info(f"User selected external file to include: {file_path}")
-                self.add_external_path_to_table(file_path)
+            logger.info(f"User selected {len(file_paths)} external files to include")
+            self.add_external_paths_to_table(file_paths)
 
     def add_external_path_to_table(self, path: str) -> None:
         """
         Add a file or folder path to the external resources table.
         """
-        if not path:
-            logger.warning(f"Invalid path provided for external resources: ({path})")
-            self.emit_operation_status.emit(0, "Invalid Path", 2000)
-            return
+        self.add_external_paths_to_table([path])
+
+    def add_external_paths_to_table(self, paths: list[str]) -> None:
+        """
+        Add file or folder paths to the external resources table in one batch.
+        """
+        external_table = self._settings.external_table
+        included = set()
+        for row in range(external_table.rowCount()):
+            item = external_table.item(row, 0)
+            if item:
+                included.add(item.text())
 
-        for row in range(self.ui.qt_package_settings.external_table.rowCount()):
-            item = self.ui.qt_package_settings.external_table.item(row, 0)
-            if item and item.text() == path:
-                logger.info(f"File or path '{path}' already in the table.")
+        new_rows = []
+        for path in paths:
+            if path in included:
+                logger.debug(f"File or path '{path}' already in the table.")
                 self.emit_operation_status.emit(
                     -1,
                     "File or Path Already Included",
                     2000,
                 )
-                return
+                continue
 
-        if os.path.isfile(path) or os.path.isdir(path):
-            # Destination Path = / + basename
-            dest_path = "/" + os.path.basename(path)
-        else:
-            # Invalid path
-            logger.warning(f"Invalid path provided for external resources: ({path})")
-            self.emit_operation_status.emit(0, "Invalid Path", 2000)
-            return
+            # One stat answers both the file and the folder test
+            try:
+                mode = os.stat(path).st_mode if path else 0
+            except OSError:
+                mode = 0
+            if stat.S_ISREG(mode) or stat.S_ISDIR(mode):
+                # Destination Path = / + basename
+                dest_path = "/" + os.path.basename(path)
+            else:
+                # Invalid path
+                logger.warning(
+                    f"Invalid path provided for external resources: ({path})"
+                )
+                self.emit_operation_status.emit(0, "Invalid Path", 2000)
+                continue
 
-        # Add a new row
-        row = self.ui.qt_package_settings.external_table.rowCount()
-        self.ui.qt_package_settings.external_table.insertRow(row)
+            included.add(path)
+            new_rows.append((path, dest_path))
 
-        # Source Path
-        src_item = QTableWidgetItem(path)
-        src_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.ui.qt_package_settings.external_table.setItem(row, 0, src_item)
+        if not new_rows:
+            return
 
-        # Destination Path
-        dest_item = QTableWidgetItem(dest_path)
-        dest_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.ui.qt_package_settings.external_table.setItem(row, 1, dest_item)
+        # Grow the table once and relayout once for the whole batch
+        external_table.setUpdatesEnabled(False)
+        row = external_table.rowCount()
+        external_table.setRowCount(row + len(new_rows))
+        for path, dest_path in new_rows:
+            # Source Path
+            src_item = QTableWidgetItem(path)
+            external_table.setItem(row, 0, src_item)
+
+            # Destination Path
+            dest_item = QTableWidgetItem(dest_path)
+            external_table.setItem(row, 1, dest_item)
+            row += 1
+        external_table.setUpdatesEnabled(True)
 
     def delete_selected_rows(self) -> None:
         """
@@ -839,13 +1001,12 @@ class QtPackage(QWidget):
         if sender.objectName() == "external_remove_button":
             # Get selected row indexes
             selected_rows = set(
-                index.row()
-                for index in self.ui.qt_package_settings.external_table.selectedIndexes()
+                index.row() for index in self._settings.external_table.selectedIndexes()
             )
 
             # Delete from bottom to top to avoid index shifting
             for row in sorted(selected_rows, reverse=True):
-                self.ui.qt_package_settings.external_table.removeRow(row)
+                self._settings.external_table.removeRow(row)
 
             logger.info(
                 f"Selected rows deleted: {selected_rows} from external_remove_button"
@@ -855,12 +1016,12 @@ class QtPackage(QWidget):
             # Get selected row indexes
             selected_rows = set(
                 index.row()
-                for index in self.ui.qt_package_settings.dependencies_table.selectedIndexes()
+                for index in self._settings.dependencies_table.selectedIndexes()
             )
 
             # Delete from bottom to top to avoid index shifting
             for row in sorted(selected_rows, reverse=True):
-                self.ui.qt_package_settings.dependencies_table.removeRow(row)
+                self._settings.dependencies_table.removeRow(row)
 
             logger.info(
                 f"Selected rows deleted: {selected_rows} from dependencies_remove_button"
@@ -870,28 +1031,27 @@ class QtPackage(QWidget):
         """
         Extract data from the QTableWidget and return it as a list of dictionaries.
         """
-        # External Data
-        data = []
-        row_count = self.ui.qt_package_settings.external_table.rowCount()
-        col_count = self.ui.qt_package_settings.external_table.columnCount()
-        headers = ["Source", "Destination"]
-
-        for row in range(row_count):
-            row_data = {}
-            for col in range(col_count):
-                item = self.ui.qt_package_settings.external_table.item(row, col)
-                row_data[headers[col]] = item.text() if item else ""
-                row_data["Type"] = "Copy Only"
-            data.append(row_data)
+        # External Data, always a Source and a Destination column
+        external_table = self._settings.external_table
+        data = [
+            {
+                "Source": source.text() if source else "",
+                "Destination": dest.text() if dest else "",
+                "Type": "Copy Only",
+            }
+            for source, dest in (
+                (external_table.item(row, 0), external_table.item(row, 1))
+                for row in range(external_table.rowCount())
+            )
+        ]
 
         # Dependencies Data
-        row_count = self.ui.qt_package_settings.dependencies_table.rowCount()
+        dependencies_table = self._settings.dependencies_table
 
-        for row in range(row_count):
+        for row in range(dependencies_table.rowCount()):
             # DLLs
-            row_data = {}
-            type_item = self.ui.qt_package_settings.dependencies_table.item(row, 1)
-            item = self.ui.qt_package_settings.dependencies_table.item(row, 2)
+            type_item = dependencies_table.item(row, 1)
+            item = dependencies_table.item(row, 2)
             if type_item is None or item is None:
                 logger.warning(f"Row {row} 2nd or 3rd column is empty, skip.")
                 continue
@@ -901,28 +1061,31 @@ class QtPackage(QWidget):
                 logger.warning(f"Skip invalid DLL file: {source_path}")
                 continue
 
-            dest_path = "/" + os.path.basename(source_path)
-            row_data["Source"] = source_path
-            row_data["Destination"] = dest_path
-            row_data["Type"] = type_item.text().strip()
-            data.append(row_data)
+            data.append(
+                {
+                    "Source": source_path,
+                    "Destination": "/" + os.path.basename(source_path),
+                    "Type": type_item.text().strip(),
+                }
+            )
 
             # Other dependencies require extra path
-            row_data = {}
-            source = self.ui.qt_package_settings.dependencies_table.item(row, 3)
-            dest = self.ui.qt_package_settings.dependencies_table.item(row, 4)
+            source = dependencies_table.item(row, 3)
+            dest = dependencies_table.item(row, 4)
             if source is None or dest is None:
-                logger.info(f"The DLL: {source_path} doesn't require extra path")
+                logger.debug(f"The DLL: {source_path} doesn't require extra path")
                 continue
 
-            source_path = source.text().strip()
-            dest_path = dest.text().strip()
-            row_data["Source"] = source_path
-            row_data["Destination"] = dest_path
-            row_data["Type"] = "Copy Only"
-            data.append(row_data)
+            data.append(
+                {
+                    "Source": source.text().strip(),
+                    "Destination": dest.text().strip(),
+                    "Type": "Copy Only",
+                }
+            )
 
-        logger.info(f"Extracted table data: {data}")
+        # The entries themselves are logged by the compiler as it copies them
+        logger.info(f"Extracted {len(data)} table entries")
         return data
 
     @pyqtSlot(int, str, int)
@@ -967,12 +1130,21 @@ class QtPackage(QWidget):
             )
 
     def html_to_plain_text(self, html: str) -> str:
-        """Convert HTML content to plain text using QTextDocument."""
+        """Convert HTML content to plain text, using QTextDocument only when needed."""
         if not html:
             return ""
-        doc = QTextDocument()
-        doc.setHtml(html)
-        return doc.toPlainText()
+        if "<" not in html and "&" not in html:
+            return html
+        lowered = html.casefold()
+        if "<style" in lowered or "<script" in lowered:
+            # Only rich notifications need the layout engine
+            from PyQt6.QtGui import QTextDocument
+
+            doc = QTextDocument()
+            doc.setHtml(html)
+            return doc.toPlainText()
+        text = HTML_TAG_PATTERN.sub("", HTML_BREAK_PATTERN.sub("\n", html))
+        return htmllib.unescape(text)
 
     def tray_notification(self, title: str, message: str):
         """
@@ -1014,24 +1186,6 @@ class QtPackage(QWidget):
         )
         ctypes.windll.user32.FlashWindowEx(ctypes.byref(flash_info))
 
-    def event(self, e):
-        """
-        Handle custom events.
-        """
-        if e.type() == ScanFinishedEvent.EVENT_TYPE:
-            self.refresh_qt_version_combobox(e.qt_versions, e.qt_mingw)
-            return True
-        return super().event(e)
-
-
-class ScanFinishedEvent(QEvent):
-    EVENT_TYPE = QEvent.Type(QEvent.registerEventType())
-
-    def __init__(self, qt_versions, qt_mingw):
-        super().__init__(ScanFinishedEvent.EVENT_TYPE)
-        self.qt_versions = qt_versions
-        self.qt_mingw = qt_mingw
-
 
 class FLASHWINFO(ctypes.Structure):
     _fields_ = [
@@ -1044,6 +1198,7 @@ class FLASHWINFO(ctypes.Structure):
 
 
 if __name__ == "__main__":
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings)
     app = QApplication(sys.argv)
     w = QtPackage()
     w.ui.show()